@@ -1,32 +1,261 @@
 """AI service for generating and refining product specifications."""
+import asyncio
+import atexit
+import collections
 import functools
+import gzip
 import hashlib
 import json
 import logging
 import os
-import pickle
+import random
+import re
+import string
 import sys
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 
 import llm
 import importlib
 
+# Use diskcache as the response cache backend when it is installed
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 from ..utils.config import Config
+from ..utils import serialization
 from ..utils.display import ask_user
-from ..utils.types import Question, DocumentDependency
+from ..utils.types import Question, DocumentDependency, Task
+
+# Upper bound in seconds on any single retry wait
+_MAX_RETRY_WAIT = 60.0
+
+# Retry policy for transient failures while generating a response
+_ASK_MAX_RETRIES = 5
+_ASK_RETRY_BASE_DELAY = 1.0
+_ASK_RETRY_MAX_DELAY = 30.0
+_ASK_RETRY_JITTER = 0.5
+
+# Provider exceptions worth retrying, matched by class name since each llm plugin defines its own
+_TRANSIENT_ERROR_RE = re.compile(r'RateLimit|ServiceUnavailable|APIConnection|Timeout|Overloaded')
+
+def _is_transient_error(error: Exception) -> bool:
+    """Return True if an error from the model is likely to succeed on retry."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    # Provider status errors share a base class whether they are transient or not
+    # (authentication, bad request, ...), so only their status code decides
+    status_code = getattr(error, 'status_code', None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    return bool(_TRANSIENT_ERROR_RE.search(type(error).__name__))
+
+# Marks prefetch threads, whose messages would otherwise print over the user's typing
+_background = threading.local()
+
+def _in_background() -> bool:
+    """Return True on a prefetch thread."""
+    return getattr(_background, 'active', False)
+
+def _notify(message: str) -> None:
+    """Print a message for the user, or log it at debug level on a prefetch thread."""
+    if _in_background():
+        logging.debug(message.strip())
+    else:
+        print(message)
+
+def _log_problem(message: str, level: int = logging.ERROR) -> None:
+    """Log a failure, demoted to debug level on a prefetch thread."""
+    logging.log(logging.DEBUG if _in_background() else level, message)
+
+# Cached responses are stored as gzipped JSON; the suffix keeps them apart from older formats
+_CACHE_FILE_SUFFIX = ".json.gz"
+
+# Bump when the cache key payload or cached value shapes change
+# (2: diskcache entries hold JSON bytes; version 1 entries were pickled)
+_CACHE_KEY_VERSION = 2
+
+# Level 1 costs little CPU and still roughly halves spec-sized text
+_CACHE_COMPRESS_LEVEL = 1
+
+# Cache entries are written to disk on this thread, shared by every AIService;
+# its worker starts on the first write and pending writes drain at exit
+_CACHE_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-cache-io")
+atexit.register(_CACHE_IO_POOL.shutdown, wait=True)
+
+# Streamed output is flushed once this many seconds have passed or this many characters are pending
+_STREAM_FLUSH_INTERVAL = 0.03
+_STREAM_FLUSH_CHARS = 4096
+
+# Matches a JSON array of flat objects, e.g. one wrapped in ```json fences or prose.
+# Whitespace after a comma belongs to the comma's group, so each separator can only
+# be matched one way and a truncated array fails in linear time
+_JSON_ARRAY_RE = re.compile(r'\[\s*(?:\{[^{}]*\}\s*(?:,\s*)?)+\]', re.DOTALL)
+
+# Matches, per line, either a short section header ending in ':' or a line
+# containing a question mark (optionally as a JSON "question" field)
+_QUESTION_LINE_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<section>[^"\s][^\n]{0,47}?):+'
+    r'|(?:"question":[ \t]*)?(?P<question>[^\n]*\?[^\n]*?)'
+    r')[ \t]*$',
+    re.MULTILINE
+)
+
+# Matches a labelled name such as "Project Name: Foo" or "**Product Name:** Foo"
+_PROJECT_NAME_RE = re.compile(r'\*{0,2}(?:Project|Product) Name\*{0,2}\s*:\s*\*{0,2}\s*([^\n*]+)', re.IGNORECASE)
+
+# Matches a task field label at the start of a line (after any list marker or
+# markdown emphasis), capturing the label and the value after its colon
+_TASK_FIELD_RE = re.compile(
+    r'^[\W\d_]*(complexity|dependencies|description|technical[ \t]*notes|testing[ \t]*notes)'
+    r'\b[^:\n]*(?::[ \t*]*(.*))?$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Task dictionary keys by normalized field label
+_TASK_FIELD_KEYS = {
+    "complexity": "complexity",
+    "dependencies": "dependencies",
+    "description": "description",
+    "technicalnotes": "technical_notes",
+    "testingnotes": "testing_notes",
+}
+
+def _compile_prompt(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a str.format-style template once into (literal text, field name) pairs."""
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+def _render_prompt(parts: List[Tuple[str, Optional[str]]], **values: str) -> str:
+    """Render a template compiled by _compile_prompt without re-parsing it."""
+    return "".join(
+        literal if field is None else literal + values[field]
+        for literal, field in parts
+    )
+
+@functools.lru_cache(maxsize=None)
+def _read_prompt(prompt_path: str) -> str:
+    """Read a prompt file once per process; prompt files do not change during a run."""
+    # Read raw bytes in one go; text mode would add decoding and newline translation layers
+    with open(prompt_path, "rb") as f:
+        text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    return text.strip()
+
+def _system_kwargs(system: Optional[str]) -> Dict[str, str]:
+    """Keyword arguments for llm's model.prompt, omitting system when there is none."""
+    return {"system": system} if system else {}
+
+def _compute_cache_key(method_name: str, model_name: str, prompt_digest: str, normalize: bool,
+                       args: Tuple[Any, ...], kwargs_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Hash a cached call's method, model, prompts and arguments into a stable key."""
+    # Specs that differ only in whitespace get the same response
+    if normalize:
+        args = tuple(" ".join(arg.split()) if isinstance(arg, str) else arg for arg in args)
+    
+    # Common case: only string arguments (usually a single spec). Hash them directly,
+    # length-prefixed, rather than JSON-escaping a large spec into one payload first
+    if not kwargs_items and all(isinstance(arg, str) for arg in args):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{_CACHE_KEY_VERSION}\0{method_name}\0{model_name}\0{prompt_digest}".encode())
+        for arg in args:
+            data = arg.encode()
+            digest.update(b"\0%d\0" % len(data))
+            digest.update(data)
+        return digest.hexdigest()
+    
+    # Canonical JSON keeps keys stable across runs (sorted dicts, no object reprs)
+    payload = {
+        "method": method_name,
+        "version": _CACHE_KEY_VERSION,
+        "model": model_name,  # Make cache key model-specific
+        "prompts": prompt_digest,  # ...and specific to the prompt files that produced it
+        "args": args,
+        "kwargs": dict(kwargs_items),
+    }
+    payload_str = json.dumps(payload, sort_keys=True, default=repr, ensure_ascii=False)
+    
+    # Create a hash of the arguments
+    return hashlib.blake2b(payload_str.encode(), digest_size=16).hexdigest()
+
+# The same spec is keyed several times per refinement round (lookup, prefetch, save)
+_memoized_cache_key = functools.lru_cache(maxsize=1024)(_compute_cache_key)
+
+def _split_system_prompt(parts: List[Tuple[str, Optional[str]]]) -> Tuple[List[Tuple[str, Optional[str]]], Optional[str]]:
+    """
+    Move the instructions that follow a compiled template's last field into a system prompt.
+    
+    Providers reuse cached work for an identical leading prefix, and the system prompt is
+    sent first. Moving the static trailing instructions there lets every call with the
+    same template share that prefix, while the spec and answers stay in the prompt.
+    
+    Args:
+        parts (List[Tuple[str, Optional[str]]]): A template compiled by _compile_prompt
+        
+    Returns:
+        Tuple[List[Tuple[str, Optional[str]]], Optional[str]]: The remaining template and
+        the system prompt, or the template unchanged and None if nothing static follows the fields
+    """
+    fields = [i for i, (_, field) in enumerate(parts) if field is not None]
+    if not fields:
+        return parts, None
+    last_field = fields[-1]
+    trailing = "".join(literal for literal, _ in parts[last_field + 1:])
+    
+    # The paragraph the last field sits in (e.g. a closing tag) stays with it
+    closing, _, instructions = trailing.partition("\n\n")
+    if not instructions.strip():
+        return parts, None
+    return parts[:last_field + 1] + [(closing, None)], instructions.strip()
+
+# The project-name prompt is a constant, so it is compiled once at import
+_PROJECT_NAME_PROMPT = _compile_prompt("""
+        Based on this product specification, suggest a concise, memorable project name.
+        Return ONLY the suggested name, nothing else.
+        
+        Specification:
+        {spec}
+        """)
 
 class AIService:
     """Service for interacting with AI models."""
     
+    # Cache directories already ensured by this process
+    _cache_dirs_created: Set[str] = set()
+    
     def __init__(self, config: Config):
         """Initialize the AI service with configuration."""
         self.config = config
-        self.llm = None  # Lazy initialization
+        self._model_handles: Dict[str, Any] = {}  # Lazily loaded models by name
+        self._model_lock = threading.Lock()
+        self._executor = None  # Lazy initialization
+        self._speculative: Dict[str, Future] = {}  # Prefetched calls by cache key
         self._load_prompts()
         
-        # Create cache directory if it doesn't exist
-        os.makedirs(self.config.CACHE_DIR, exist_ok=True)
+        # Create cache directory if it doesn't exist (once per process)
+        if self.config.CACHE_DIR not in AIService._cache_dirs_created:
+            os.makedirs(self.config.CACHE_DIR, exist_ok=True)
+            AIService._cache_dirs_created.add(self.config.CACHE_DIR)
+        self._cache_prefix = os.path.join(os.fspath(self.config.CACHE_DIR), "")
+        
+        # In-process LRU tier in front of the disk cache
+        self._mem_cache: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+        self._mem_cache_lock = threading.Lock()
+        
+        # A single SQLite-backed store replaces the file-per-key layout when available
+        self._disk_cache = None
+        if DISKCACHE_AVAILABLE:
+            self._disk_cache = diskcache.Cache(
+                self.config.CACHE_DIR,
+                size_limit=self.config.CACHE_SIZE_LIMIT,
+                eviction_policy='least-recently-used'
+            )
     
     def _load_prompts(self) -> None:
         """Load all prompts from files."""
@@ -48,43 +277,82 @@ class AIService:
                 logging.warning(f"Could not find dependencies for document type '{doc_type}', assuming none: {e}")
                 self.dependencies = []
                 
+            # Read every prompt for this document type in a single directory scan
+            prompts = self._load_prompt_dir(doc_type)
+            
+            def require(name: str) -> str:
+                if name not in prompts:
+                    raise ValueError(f"Failed to load prompt file {doc_type}/{name}: file not found")
+                return prompts[name]
+            
+            self.initial_prompt = require("initial.txt")
+            
             # Define required prompts based on document type
             if doc_type == "engineering_todo":
                 # For engineering_todo type, we only need the initial prompt
-                self.initial_prompt = self._load_prompt_file(f"{doc_type}/initial.txt")
                 self.refinement_prompt = None
                 self.final_refinement_prompt = None
-                self.todo_prompt = None
             elif doc_type == "product_requirements":
                 # For product_requirements type
-                self.initial_prompt = self._load_prompt_file(f"{doc_type}/initial.txt")
-                self.refinement_prompt = self._load_prompt_file(f"{doc_type}/refinement.txt")
-                self.final_refinement_prompt = self._load_prompt_file(f"{doc_type}/final_refinement.txt")
-                # No todo prompt for product_requirements - we use engineering_todo for that
-                self.todo_prompt = None
+                self.refinement_prompt = require("refinement.txt")
+                self.final_refinement_prompt = require("final_refinement.txt")
             else:
-                # For any other document types, try to load standard prompts
-                self.initial_prompt = self._load_prompt_file(f"{doc_type}/initial.txt")
-                
-                # Try to load optional prompts but don't fail if missing
-                try:
-                    self.refinement_prompt = self._load_prompt_file(f"{doc_type}/refinement.txt")
-                except ValueError:
-                    self.refinement_prompt = None
+                # For any other document types, the remaining prompts are optional
+                self.refinement_prompt = prompts.get("refinement.txt")
+                if self.refinement_prompt is None:
                     logging.info(f"Refinement prompt not found for document type '{doc_type}'")
                     
-                try:
-                    self.final_refinement_prompt = self._load_prompt_file(f"{doc_type}/final_refinement.txt")
-                except ValueError:
-                    self.final_refinement_prompt = None
+                self.final_refinement_prompt = prompts.get("final_refinement.txt")
+                if self.final_refinement_prompt is None:
                     logging.info(f"Final refinement prompt not found for document type '{doc_type}'")
-                    
-                self.todo_prompt = None
+            
+            # No todo prompt - we use the engineering_todo document type for that
+            self.todo_prompt = None
+            
+            # Editing a prompt file (or switching document type) must not serve
+            # responses generated from the old prompts
+            prompt_source = "\0".join(f"{name}\0{prompts[name]}" for name in sorted(prompts))
+            self._prompt_digest = hashlib.blake2b(
+                f"{doc_type}\0{prompt_source}".encode(), digest_size=8
+            ).hexdigest()
+            
+            # Precompile the templates that are formatted on every refinement round,
+            # splitting off their static instructions as a cacheable system prompt
+            self._refinement_template, self._refinement_system = (
+                _split_system_prompt(_compile_prompt(self.refinement_prompt)) if self.refinement_prompt else (None, None)
+            )
+            self._final_refinement_template, self._final_refinement_system = (
+                _split_system_prompt(_compile_prompt(self.final_refinement_prompt))
+                if self.final_refinement_prompt else (None, None)
+            )
                     
         except ValueError as e:
             logging.error(f"Error loading prompts for document type '{doc_type}': {str(e)}")
             sys.exit(1)
     
+    def _load_prompt_dir(self, doc_type: str) -> Dict[str, str]:
+        """
+        Load all prompt files for a document type with one directory scan.
+        
+        Args:
+            doc_type (str): The document type whose prompt directory to read
+            
+        Returns:
+            Dict[str, str]: Prompt contents keyed by file name (e.g. 'initial.txt')
+            
+        Raises:
+            ValueError: If the prompt directory or a prompt file cannot be read
+        """
+        prompts = {}
+        try:
+            with os.scandir(os.path.join(self.config.PROMPT_DIR, doc_type)) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".txt") and entry.is_file():
+                        prompts[entry.name] = self._load_prompt_file(f"{doc_type}/{entry.name}")
+        except OSError as e:
+            raise ValueError(f"Failed to read prompt directory for {doc_type}: {str(e)}")
+        return prompts
+    
     def _load_prompt_file(self, prompt_file: str) -> str:
         """
         Load a prompt from a file in the prompts directory.
@@ -100,63 +368,144 @@ class AIService:
         """
         prompt_path = os.path.join(self.config.PROMPT_DIR, prompt_file)
         try:
-            with open(prompt_path, "r") as f:
-                return f.read().strip()
-        except IOError as e:
+            return _read_prompt(prompt_path)
+        except OSError as e:
             raise ValueError(f"Failed to load prompt file {prompt_file}: {str(e)}")
     
     def get_cache_key(self, method_name: str, *args: Any, **kwargs: Any) -> str:
         """Generate a cache key based on method name and arguments."""
-        # Create a string representation of the arguments
-        args_str = str(args) + str(sorted(kwargs.items()))
-        
-        # Add model name to make cache key model-specific
-        model_key = f"{self.config.MODEL_NAME}:{args_str}"
-        
-        # Create a hash of the arguments
-        key = hashlib.md5(f"{method_name}:{model_key}".encode()).hexdigest()
-        return key
+        config = self.config
+        # Cached methods are almost always called positionally
+        kwargs_items = tuple(sorted(kwargs.items())) if kwargs else ()
+        key_args = (method_name, config.MODEL_NAME, self._prompt_digest, config.NORMALIZE_CACHE_KEYS, args, kwargs_items)
+        try:
+            return _memoized_cache_key(*key_args)
+        except TypeError:
+            # Unhashable arguments (e.g. a dependency dict) cannot be memoized
+            return _compute_cache_key(*key_args)
+    
+    def get_cache_ttl(self, method_name: str) -> int:
+        """Get how long, in seconds, responses from a cached method stay valid."""
+        return self.config.CACHE_TTLS.get(method_name, self.config.CACHE_EXPIRY)
     
-    def get_cached_response(self, cache_key: str) -> Optional[str]:
-        """Try to get a cached response."""
-        cache_file = os.path.join(self.config.CACHE_DIR, cache_key)
+    def get_cached_response(self, cache_key: str, ttl: Optional[int] = None) -> Optional[str]:
+        """Try to get a cached response no older than ttl seconds (default CACHE_EXPIRY)."""
+        with self._mem_cache_lock:
+            if cache_key in self._mem_cache:
+                self._mem_cache.move_to_end(cache_key)
+                logging.debug(f"Memory cache hit for key {cache_key}")
+                return self._mem_cache[cache_key]
         
-        if os.path.exists(cache_file):
-            # Check if cache has expired
-            if time.time() - os.path.getmtime(cache_file) > self.config.CACHE_EXPIRY:
-                logging.debug(f"Cache expired for key {cache_key}")
-                return None
-                
+        cached_data = self._read_from_disk_cache(cache_key, self.config.CACHE_EXPIRY if ttl is None else ttl)
+        if cached_data is not None:
+            # Later lookups in this process are served from memory
+            self._remember(cache_key, cached_data)
+        return cached_data
+    
+    def _read_from_disk_cache(self, cache_key: str, ttl: int) -> Optional[Any]:
+        """Read a response from the disk cache, or None if it is missing or expired."""
+        if self._disk_cache is not None:
             try:
-                with open(cache_file, 'rb') as f:
-                    cached_data = pickle.load(f)
-                    logging.debug(f"Cache hit for key {cache_key}")
-                    return cached_data
+                # diskcache drops entries once their expiry has passed
+                cached_bytes = self._disk_cache.get(cache_key)
+                if cached_bytes is None:
+                    return None
+                logging.debug(f"Cache hit for key {cache_key}")
+                return serialization.loads(cached_bytes)
             except Exception as e:
                 logging.warning(f"Error reading cache: {e}")
+                return None
+        
+        cache_file = self._cache_prefix + cache_key + _CACHE_FILE_SUFFIX
+        
+        # A single stat both checks for the entry and gives its age
+        try:
+            st = os.stat(cache_file)
+        except FileNotFoundError:
+            return None
+        
+        # Check if cache has expired
+        if time.time() - st.st_mtime > ttl:
+            logging.debug(f"Cache expired for key {cache_key}")
+            return None
+            
+        try:
+            # Unbuffered: the whole entry is read in one call, so a buffer layer only adds a copy
+            with open(cache_file, 'rb', buffering=0) as f:
+                cached_data = serialization.loads(gzip.decompress(f.read()))
+                logging.debug(f"Cache hit for key {cache_key}")
+                return cached_data
+        except Exception as e:
+            logging.warning(f"Error reading cache: {e}")
                 
         return None
     
-    def save_to_cache(self, cache_key: str, data: Any) -> None:
-        """Save response to cache."""
-        cache_file = os.path.join(self.config.CACHE_DIR, cache_key)
+    def save_to_cache(self, cache_key: str, data: Any, ttl: Optional[int] = None) -> None:
+        """Save response to cache, valid for ttl seconds (default CACHE_EXPIRY)."""
+        self._remember(cache_key, data)
         
+        # The caller already has the data, so it need not wait for the disk write
+        _CACHE_IO_POOL.submit(
+            self._write_to_disk_cache, cache_key, data, self.config.CACHE_EXPIRY if ttl is None else ttl
+        )
+    
+    def _remember(self, cache_key: str, data: Any) -> None:
+        """Store a response in the in-memory LRU tier, evicting the oldest beyond its size."""
+        with self._mem_cache_lock:
+            self._mem_cache[cache_key] = data
+            self._mem_cache.move_to_end(cache_key)
+            if len(self._mem_cache) > self.config.MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+    
+    def _write_to_disk_cache(self, cache_key: str, data: Any, ttl: int) -> None:
+        """Write a response to the disk cache."""
+        if self._disk_cache is not None:
+            try:
+                # Stored as JSON bytes, which diskcache keeps as-is, rather than
+                # letting it pickle the value
+                self._disk_cache.set(cache_key, serialization.dumps(data), expire=ttl)
+                logging.debug(f"Saved to cache: {cache_key}")
+            except Exception as e:
+                logging.warning(f"Error saving to cache: {e}")
+            return
+        
+        cache_file = self._cache_prefix + cache_key + _CACHE_FILE_SUFFIX
+        
+        # Write to a temporary file and rename it into place so readers never see a partial entry
+        tmp_file = f"{cache_file}.tmp.{os.getpid()}"
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            with open(tmp_file, 'wb') as f:
+                f.write(gzip.compress(serialization.dumps(data), compresslevel=_CACHE_COMPRESS_LEVEL))
+            os.replace(tmp_file, cache_file)
             logging.debug(f"Saved to cache: {cache_key}")
         except Exception as e:
             logging.warning(f"Error saving to cache: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
     def cached_ai_call(method):
         """Decorator to cache AI calls."""
         @functools.wraps(method)
         def wrapper(self, *args, **kwargs):
+            # Skip key computation and cache lookups entirely when caching is off
+            if not self.config.CACHE_ENABLED:
+                return method(self, *args, **kwargs)
+            
             # Generate cache key
             cache_key = self.get_cache_key(method.__name__, *args, **kwargs)
+            ttl = self.get_cache_ttl(method.__name__)
+            
+            # Reuse a prefetched call with the same arguments instead of repeating it.
+            # Checked first: a finished prefetch has already saved its result and
+            # removed itself, so it is then found by the cache lookup below
+            pending = self._speculative.pop(cache_key, None)
+            if pending is not None:
+                return pending.result()
             
             # Try to get cached response
-            cached_response = self.get_cached_response(cache_key)
+            cached_response = self.get_cached_response(cache_key, ttl)
             if cached_response is not None:
                 return cached_response
             
@@ -164,47 +513,115 @@ class AIService:
             result = method(self, *args, **kwargs)
             
             # Save result to cache
-            self.save_to_cache(cache_key, result)
+            self.save_to_cache(cache_key, result, ttl)
             
             return result
         return wrapper
     
-    def _get_model(self, max_retries: int = 3, retry_delay: float = 2.0):
-        """Get the AI model with retry logic."""
-        if self.llm is not None:
-            return self.llm
-            
-        import importlib.util
+    def prefetch(self, method, *args: Any) -> None:
+        """
+        Speculatively start a cached AI call in the background.
         
-        if importlib.util.find_spec("llm") is None:
-            error_msg = "Error: The 'llm' package is not installed. Please install it with 'pip install llm'."
-            logging.error(error_msg)
-            print(error_msg)
-            return None
-            
-        import llm
+        A later call to the same method with the same arguments waits for this
+        result instead of issuing a new request. The call runs on a daemon thread
+        so an unused prediction never delays exit.
+        
+        Args:
+            method: A bound method decorated with cached_ai_call, e.g. self.finalize_spec
+            *args: The positional arguments the method will later be called with
+        """
+        if not self.config.CACHE_ENABLED:
+            return
+        
+        cache_key = self.get_cache_key(method.__name__, *args)
+        ttl = self.get_cache_ttl(method.__name__)
+        if cache_key in self._speculative or self.get_cached_response(cache_key, ttl) is not None:
+            return
         
-        for attempt in range(max_retries):
+        future: Future = Future()
+        
+        def run() -> None:
+            _background.active = True
             try:
-                self.llm = llm.get_model(self.config.MODEL_NAME)
-                return self.llm
-            except ConnectionError as e:
-                if attempt < max_retries - 1:
-                    wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                    logging.warning(f"Connection error: {e}. Retrying in {wait_time:.1f} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logging.error(f"Failed to connect to AI model after {max_retries} attempts: {e}")
-                    print(f"Error: Could not connect to the AI model. Please check your internet connection.")
-                    return None
+                result = method.__wrapped__(self, *args)
+                self.save_to_cache(cache_key, result, ttl)
+                future.set_result(result)
             except Exception as e:
-                logging.error(f"Error getting AI model: {e}")
-                print(f"Error: Could not load the AI model '{self.config.MODEL_NAME}'. Try using a different model.")
-                return None
+                logging.debug(f"Prefetched {method.__name__} failed: {e}")
+                future.set_exception(e)
+        
+        def forget(done: Future) -> None:
+            # The result is in the cache by now; a failed prediction is simply dropped
+            if self._speculative.get(cache_key) is done:
+                del self._speculative[cache_key]
+        
+        self._speculative[cache_key] = future
+        future.add_done_callback(forget)
+        threading.Thread(target=run, name="ai-prefetch", daemon=True).start()
+    
+    def prewarm(self, model_name: Optional[str] = None) -> None:
+        """
+        Load the model in the background while the user is still typing.
+        
+        Resolving a model imports its plugin and reads its key, which otherwise
+        delays the first request. Failures are only logged here; the first real
+        call loads the model again and reports any error.
+        
+        Args:
+            model_name (str, optional): Model to load. Defaults to the configured model.
+        """
+        model_name = model_name or self.config.MODEL_NAME
+        
+        def load() -> None:
+            try:
+                # Holding the lock makes a concurrent _get_model wait for this load
+                with self._model_lock:
+                    if model_name not in self._model_handles:
+                        self._model_handles[model_name] = llm.get_model(model_name)
+            except Exception as e:
+                logging.debug(f"Prewarming model {model_name} failed: {e}")
+        
+        threading.Thread(target=load, name="ai-prewarm", daemon=True).start()
+    
+    def _get_model(self, model_name: Optional[str] = None, max_retries: int = 3, retry_delay: float = 2.0):
+        """Get the AI model with retry logic, reusing models that are already loaded."""
+        model_name = model_name or self.config.MODEL_NAME
+        model = self._model_handles.get(model_name)
+        if model is not None:
+            return model
+        
+        with self._model_lock:
+            # Another thread may have loaded the model while we waited for the lock
+            model = self._model_handles.get(model_name)
+            if model is not None:
+                return model
+            
+            for attempt in range(max_retries):
+                try:
+                    model = llm.get_model(model_name)
+                    self._model_handles[model_name] = model
+                    return model
+                except ConnectionError as e:
+                    if attempt < max_retries - 1:
+                        # Exponential backoff with jitter so clients that failed together
+                        # do not all retry in lockstep
+                        backoff = retry_delay * (2 ** attempt)
+                        wait_time = min(backoff + random.uniform(0, 0.3 * backoff), _MAX_RETRY_WAIT)
+                        _log_problem(f"Connection error: {e}. Retrying in {wait_time:.1f} seconds...", logging.WARNING)
+                        time.sleep(wait_time)
+                    else:
+                        _log_problem(f"Failed to connect to AI model after {max_retries} attempts: {e}")
+                        _notify("Error: Could not connect to the AI model. Please check your internet connection.")
+                        return None
+                except Exception as e:
+                    _log_problem(f"Error getting AI model: {e}")
+                    _notify(f"Error: Could not load the AI model '{model_name}'. Try using a different model.")
+                    return None
         
         return None
 
-    def ask(self, prompt: str, model_name: Optional[str] = None, stream: bool = True, show_response: bool = True) -> str:
+    def ask(self, prompt: str, model_name: Optional[str] = None, stream: bool = True, show_response: bool = True,
+            system: Optional[str] = None) -> str:
         """
         Calls the AI model using the llm library.
 
@@ -213,69 +630,127 @@ class AIService:
             model_name (str, optional): The name of the model to use. If None, uses the default from config.
             stream (bool): Whether to stream the response.
             show_response (bool): Whether to print the response when not streaming.
+            system (str, optional): Static instructions to send as the system prompt.
 
         Returns:
             str: The full AI-generated response.
         """
-        # Set model name if provided, otherwise use default
-        if model_name:
-            current_model_name = self.config.MODEL_NAME
-            self.config.MODEL_NAME = model_name
-            self.llm = None  # Reset to force reload with new model
+        # Use the requested model for this call only; the config is left untouched
+        model_name = model_name or self.config.MODEL_NAME
         
         try:
             # Get the model
-            model = self._get_model()
+            model = self._get_model(model_name)
             if not model:
                 return "ERROR: Could not access the AI model."
             
-            # Generate the response
             if stream:
-                print(f"\n🤖 AI Response (Streaming with {self.config.MODEL_NAME})...")
-                response_text = ""
-                # Stream the response as it's generated
-                for chunk in model.prompt(prompt):
-                    print(chunk, end="", flush=True)
-                    response_text += chunk
+                print(f"\n🤖 AI Response (Streaming with {model_name})...")
+            
+            for attempt in range(_ASK_MAX_RETRIES):
+                chunks: List[str] = []
+                try:
+                    # Generate the response
+                    if stream:
+                        response_text = self._stream_response(model, prompt, system, chunks)
+                        print("\n")
+                        return response_text
+                    response_text = self._complete_response(model, prompt, system)
+                    break
+                except Exception as e:
+                    # Retrying a stream that has already printed output would repeat it
+                    if chunks or attempt == _ASK_MAX_RETRIES - 1 or not _is_transient_error(e):
+                        raise
+                    backoff = _ASK_RETRY_BASE_DELAY * (2 ** attempt)
+                    wait_time = min(backoff + random.uniform(0, _ASK_RETRY_JITTER), _ASK_RETRY_MAX_DELAY)
+                    _log_problem(f"Transient error from AI model: {e}. Retrying in {wait_time:.1f} seconds...", logging.WARNING)
+                    time.sleep(wait_time)
+            
+            if show_response and not _in_background():
+                print(f"\n🤖 AI Response (Using {model_name})...")
+                print(response_text)
                 print("\n")
-                return response_text.strip()
             else:
-                # For non-streaming responses, ensure we get the complete response
-                response = model.prompt(prompt)
-                response_text = response.text()
-                
-                # Log the raw response for debugging
-                logging.debug(f"Raw model response: {response_text}")
-                
-                # Clean up the response
-                response_text = response_text.strip()
-                
-                # For JSON responses, ensure we have complete JSON
-                if response_text.startswith("{"):
-                    # Find the last closing brace
-                    last_brace = response_text.rfind("}")
-                    if last_brace != -1:
-                        response_text = response_text[:last_brace + 1]
-                    else:
-                        logging.warning("Response appears to be JSON but is incomplete")
-                
-                if show_response:
-                    print(f"\n🤖 AI Response (Using {self.config.MODEL_NAME})...")
-                    print(response_text)
-                    print("\n")
-                else:
-                    print(f"\n🤖 Processing AI response (Using {self.config.MODEL_NAME})...")
-                
-                return response_text
+                # Logged rather than printed: prefetched calls run while the user is typing
+                logging.debug(f"Processing AI response (Using {model_name})")
+            
+            return response_text
                 
         except Exception as e:
-            logging.error(f"Error calling AI model: {str(e)}")
+            _log_problem(f"Error calling AI model: {str(e)}")
             return f"ERROR: Problem with the AI model response. {str(e)}"
-        finally:
-            # Restore original model name if it was changed
-            if model_name:
-                self.config.MODEL_NAME = current_model_name
-                self.llm = None  # Reset to force reload with original model
+    
+    def _stream_response(self, model: Any, prompt: str, system: Optional[str], chunks: List[str]) -> str:
+        """
+        Stream a response to stdout as it is generated.
+        
+        Args:
+            model (Any): The llm model to prompt
+            prompt (str): The input prompt
+            system (Optional[str]): The system prompt, if any
+            chunks (List[str]): Receives each chunk as it arrives, so callers can tell
+                whether any output was shown before a failure
+            
+        Returns:
+            str: The full response text
+        """
+        out = sys.stdout
+        # Write encoded chunks straight to the underlying byte stream when there is
+        # one, skipping the text layer; anything already queued there goes first
+        buffer = getattr(out, "buffer", None)
+        if buffer is not None:
+            out.flush()
+            out = buffer
+            encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+        last_flush = time.monotonic()
+        unflushed = 0
+        # Stream the response as it's generated, flushing at a bounded rate
+        # rather than once per token
+        for chunk in model.prompt(prompt, stream=True, **_system_kwargs(system)):
+            out.write(chunk.encode(encoding, "replace") if buffer is not None else chunk)
+            chunks.append(chunk)
+            unflushed += len(chunk)
+            now = time.monotonic()
+            if unflushed >= _STREAM_FLUSH_CHARS or now - last_flush >= _STREAM_FLUSH_INTERVAL:
+                out.flush()
+                last_flush = now
+                unflushed = 0
+        out.flush()
+        return "".join(chunks).strip()
+    
+    def _complete_response(self, model: Any, prompt: str, system: Optional[str]) -> str:
+        """
+        Request a whole response without streaming it.
+        
+        Args:
+            model (Any): The llm model to prompt
+            prompt (str): The input prompt
+            system (Optional[str]): The system prompt, if any
+            
+        Returns:
+            str: The cleaned-up response text
+        """
+        # Request the whole completion in one payload rather than consuming
+        # a chunked stream we never display
+        response = model.prompt(prompt, stream=False, **_system_kwargs(system))
+        response_text = response.text()
+        
+        # Log the raw response for debugging
+        logging.debug(f"Raw model response: {response_text}")
+        
+        # Clean up the response
+        response_text = response_text.strip()
+        
+        # For JSON responses, ensure we have complete JSON
+        if response_text.startswith("{"):
+            # Find the last closing brace
+            last_brace = response_text.rfind("}")
+            if last_brace != -1:
+                response_text = response_text[:last_brace + 1]
+            else:
+                logging.warning("Response appears to be JSON but is incomplete")
+        
+        return response_text
 
     def get_document_dependencies(self) -> List[DocumentDependency]:
         """Get the dependencies for the current document type."""
@@ -309,12 +784,7 @@ class AIService:
         Returns:
             str: Initial product specification
         """
-        prompt = self.initial_prompt + f"\n\nProduct description: {description}"
-        
-        # Apply any dependency values
-        if dependency_values:
-            prompt = self.apply_dependencies(prompt, dependency_values)
-            
+        prompt = self._build_initial_prompt(description, dependency_values)
         response = self.ask(prompt, stream=False, show_response=False)
         
         if response.startswith("ERROR:"):
@@ -330,6 +800,54 @@ class AIService:
         
         return response
     
+    def _build_initial_prompt(self, description: str, dependency_values: Optional[Dict[str, str]] = None) -> str:
+        """Build the prompt for an initial specification."""
+        prompt = self.initial_prompt + f"\n\nProduct description: {description}"
+        
+        # Apply any dependency values
+        if dependency_values:
+            prompt = self.apply_dependencies(prompt, dependency_values)
+        return prompt
+    
+    def stream_initial_spec(self, description: str, dependency_values: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """
+        Stream an initial product specification as it is generated.
+        
+        A cached specification is yielded in one piece. A streamed one is cached once it
+        is complete, so generate_initial_spec with the same arguments reuses it.
+        
+        Args:
+            description (str): Brief description of the product
+            dependency_values (Optional[Dict[str, str]]): Values for any dependencies
+            
+        Yields:
+            str: Chunks of the specification text
+            
+        Raises:
+            RuntimeError: If the AI model cannot be loaded
+            Exception: Any error raised by the model while streaming
+        """
+        cache_key = None
+        if self.config.CACHE_ENABLED:
+            cache_key = self.get_cache_key("generate_initial_spec", description, dependency_values)
+            ttl = self.get_cache_ttl("generate_initial_spec")
+            cached_response = self.get_cached_response(cache_key, ttl)
+            if cached_response is not None:
+                yield cached_response
+                return
+        
+        model = self._get_model()
+        if not model:
+            raise RuntimeError("Could not access the AI model.")
+        
+        chunks = []
+        for chunk in model.prompt(self._build_initial_prompt(description, dependency_values), stream=True):
+            chunks.append(chunk)
+            yield chunk
+        
+        if cache_key is not None:
+            self.save_to_cache(cache_key, "".join(chunks).strip(), ttl)
+    
     def _extract_questions_from_text(self, text: str) -> List[Dict[str, str]]:
         """
         Fallback method to extract questions from text if JSON parsing fails.
@@ -340,37 +858,60 @@ class AIService:
         Returns:
             List[Dict[str, str]]: List of extracted questions
         """
-        questions = []
+        # Without a question mark there is nothing to extract
+        if '?' not in text:
+            logging.info("Extracted 0 questions using fallback method")
+            return []
         
-        # Simple heuristic: look for lines that might contain questions
-        lines = text.split('\n')
+        questions = []
         current_section = "General"
         
-        for line in lines:
-            line = line.strip()
-            
-            # Try to identify section headers
-            if line.endswith(':') and not line.startswith('"') and len(line) < 50:
-                current_section = line.rstrip(':').strip()
+        # Simple heuristic: short lines ending in ':' are section headers and
+        # lines containing '?' might be questions
+        for match in _QUESTION_LINE_RE.finditer(text):
+            section = match.group('section')
+            if section is not None:
+                current_section = section.strip()
                 continue
             
-            # Clean up JSON-like text
-            if line.startswith('"question":'):
-                line = line.replace('"question":', '').strip()
-                if line.startswith('"') and line.endswith('"'):
-                    line = line[1:-1]  # Remove quotes
-            
-            # Look for question marks
-            if '?' in line and len(line) > 10:
-                # Clean up any remaining JSON artifacts
-                line = line.strip('",')
+            # Clean up any JSON artifacts around the question
+            question = match.group('question').strip().strip('",')
+            if len(question) > 10 and '?' in question:
+                # Only one question is returned to avoid flooding the user,
+                # so the rest of the text need not be scanned
                 questions.append({
                     'section': current_section,
-                    'question': line
+                    'question': question
                 })
+                break
                 
         logging.info(f"Extracted {len(questions)} questions using fallback method")
-        return questions[:1]  # Return at most one question to avoid flooding the user
+        return questions
+    
+    def _parse_json_array(self, text: str) -> Any:
+        """
+        Parse a JSON array that may be surrounded by prose or markdown fences.
+        
+        Args:
+            text (str): The AI response text
+            
+        Returns:
+            Any: The parsed JSON value
+            
+        Raises:
+            json.JSONDecodeError: If no JSON array can be parsed from the text
+        """
+        # Fast path: the outermost brackets usually delimit the whole array
+        start, end = text.find('['), text.rfind(']')
+        if 0 <= start < end:
+            try:
+                return serialization.loads(text[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+        
+        # Brackets in the surrounding prose; search for the array itself
+        match = _JSON_ARRAY_RE.search(text)
+        return serialization.loads(match.group(0) if match else text)
     
     @cached_ai_call
     def get_follow_up_questions(self, spec: str, answered_questions_text: str) -> List[Question]:
@@ -384,22 +925,23 @@ class AIService:
         Returns:
             List[Question]: List of questions with 'section' and 'question' keys
         """
-        refinement_prompt = self.refinement_prompt.format(
+        refinement_prompt = _render_prompt(
+            self._refinement_template,
             spec=spec,
             answered_questions=answered_questions_text
         )
-        response = self.ask(refinement_prompt, stream=False, show_response=False)
+        response = self.ask(refinement_prompt, stream=False, show_response=False, system=self._refinement_system)
         
         if response.startswith("ERROR:"):
-            logging.error(f"Error in get_follow_up_questions: {response}")
+            _log_problem(f"Error in get_follow_up_questions: {response}")
             # Return an empty array to prevent further errors
             return []
         
-        # Parse the JSON response
+        # Parse the JSON response, extracting the array if the model wrapped it
         try:
-            questions = json.loads(response)
+            questions = self._parse_json_array(response)
             if not isinstance(questions, list):
-                logging.error("AI response is not a JSON array")
+                _log_problem("AI response is not a JSON array")
                 return []
                 
             # Validate each question has the expected fields
@@ -408,12 +950,12 @@ class AIService:
                 if isinstance(question, dict) and 'section' in question and 'question' in question:
                     valid_questions.append(question)
                 else:
-                    logging.warning(f"Skipping invalid question format: {question}")
+                    _log_problem(f"Skipping invalid question format: {question}", logging.WARNING)
                     
             return valid_questions
             
         except json.JSONDecodeError as e:
-            logging.error(f"Failed to parse AI response as JSON: {e}")
+            _log_problem(f"Failed to parse AI response as JSON: {e}")
             # Try to extract questions if JSON parsing failed
             return self._extract_questions_from_text(response)
     
@@ -428,12 +970,12 @@ class AIService:
         Returns:
             str: The finalized product specification
         """
-        final_prompt = self.final_refinement_prompt.format(spec=spec)
-        response = self.ask(final_prompt, stream=False, show_response=False)
+        final_prompt = _render_prompt(self._final_refinement_template, spec=spec)
+        response = self.ask(final_prompt, stream=False, show_response=False, system=self._final_refinement_system)
         
         if response.startswith("ERROR:"):
-            print(f"\n⚠️ {response}")
-            print("\n⚠️ Unable to finalize the specification. Returning the unfinalized version.")
+            _notify(f"\n⚠️ {response}")
+            _notify("\n⚠️ Unable to finalize the specification. Returning the unfinalized version.")
             return spec
         
         return response
@@ -449,22 +991,50 @@ class AIService:
         Returns:
             str: The suggested project name
         """
-        prompt = """
-        Based on this product specification, suggest a concise, memorable project name.
-        Return ONLY the suggested name, nothing else.
-        
-        Specification:
-        {spec}
-        """.format(spec=spec)
+        prompt = _render_prompt(_PROJECT_NAME_PROMPT, spec=spec)
         
         response = self.ask(prompt, stream=False, show_response=True)
         
         if response.startswith("ERROR:"):
-            print(f"\n⚠️ {response}")
+            _notify(f"\n⚠️ {response}")
             return "untitled_project"
         
+        # Models sometimes label the name despite the instructions
+        match = _PROJECT_NAME_RE.search(response)
+        if match:
+            return match.group(1).strip()
         return response.strip()
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to run AI calls concurrently."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.MAX_CONCURRENT_REQUESTS,
+                thread_name_prefix="ai-request"
+            )
+        return self._executor
+    
+    async def _run_async(self, method, *args: Any) -> Any:
+        """Run a blocking AI call on the request thread pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(method, *args))
+    
+    async def generate_initial_spec_async(self, description: str, dependency_values: Optional[Dict[str, str]] = None) -> str:
+        """Async variant of generate_initial_spec."""
+        return await self._run_async(self.generate_initial_spec, description, dependency_values)
+    
+    async def finalize_spec_async(self, spec: str) -> str:
+        """Async variant of finalize_spec."""
+        return await self._run_async(self.finalize_spec, spec)
+    
+    async def get_follow_up_questions_async(self, spec: str, answered_questions_text: str) -> List[Question]:
+        """Async variant of get_follow_up_questions."""
+        return await self._run_async(self.get_follow_up_questions, spec, answered_questions_text)
+    
+    async def suggest_project_name_async(self, spec: str) -> str:
+        """Async variant of suggest_project_name."""
+        return await self._run_async(self.suggest_project_name, spec)
+    
     @cached_ai_call
     def generate_todo_list(self, spec: str) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -501,9 +1071,33 @@ class AIService:
         tasks = []
         
         try:
-            # Generate tasks for each section separately
-            for section in sections:
-                section_prompt = f"""
+            # Sections are independent, so request them concurrently (bounded like
+            # every other batch of AI calls); map keeps the results in section order
+            workers = min(len(sections), self.config.MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-todo") as executor:
+                responses = executor.map(
+                    lambda section: self.ask(self._todo_section_prompt(section, spec), stream=False, show_response=False),
+                    sections
+                )
+                for section, response in zip(sections, responses):
+                    if response.startswith("ERROR:"):
+                        logging.error(f"Error generating tasks for section {section}: {response}")
+                        continue
+                        
+                    # Parse the response into task objects manually
+                    task_blocks = self._parse_tasks_from_text(response, section)
+                    tasks.extend(task_blocks)
+        
+        finally:
+            # Always restore the original document type
+            self.config.DOCUMENT_TYPE = original_doc_type
+            self._load_prompts()
+        
+        return {"tasks": tasks}
+        
+    def _todo_section_prompt(self, section: str, spec: str) -> str:
+        """Build the prompt asking for the tasks in one todo-list section."""
+        return f"""
                 You are a technical lead creating an engineering todo list for a product.
                 For the '{section}' section only, create 2-3 focused tasks based on this specification:
                 
@@ -519,25 +1113,8 @@ class AIService:
                 
                 Format your response as a clean simple list with clear sections. Do not include any explanations or formatting beyond the task details.
                 """
-                
-                response = self.ask(section_prompt, stream=False, show_response=False)
-                
-                if response.startswith("ERROR:"):
-                    logging.error(f"Error generating tasks for section {section}: {response}")
-                    continue
-                    
-                # Parse the response into task objects manually
-                task_blocks = self._parse_tasks_from_text(response, section)
-                tasks.extend(task_blocks)
         
-        finally:
-            # Always restore the original document type
-            self.config.DOCUMENT_TYPE = original_doc_type
-            self._load_prompts()
-        
-        return {"tasks": tasks}
-        
-    def _parse_tasks_from_text(self, text: str, section: str) -> List[Dict[str, Any]]:
+    def _parse_tasks_from_text(self, text: str, section: str) -> List[Task]:
         """
         Parse tasks from the AI-generated text.
         
@@ -546,14 +1123,14 @@ class AIService:
             section (str): The section these tasks belong to
             
         Returns:
-            List[Dict[str, Any]]: List of parsed tasks
+            List[Task]: List of parsed tasks
         """
         tasks = []
         
         # Split text by double newlines to separate tasks
         blocks = text.split("\n\n")
         
-        current_task = {"section": section}
+        current_task: Optional[Task] = None
         
         for block in blocks:
             block = block.strip()
@@ -561,15 +1138,13 @@ class AIService:
                 continue
                 
             # Check if this block is a new task (starts with a number or has "Task" in the first line)
-            if block[0].isdigit() or "Task" in block.split("\n")[0]:
+            if block[0].isdigit() or "Task" in block.partition("\n")[0]:
                 # If we have a task in progress, save it and start a new one
-                if "title" in current_task:
+                if current_task is not None:
                     tasks.append(current_task)
-                current_task = {"section": section}
                 
                 # The first line is the title
-                lines = block.split("\n")
-                title_line = lines[0]
+                title_line = block.partition("\n")[0]
                 # Remove any numbering or "Task:" prefix
                 title = title_line.strip()
                 if ":" in title:
@@ -577,62 +1152,56 @@ class AIService:
                 elif "." in title and title.split(".", 1)[0].isdigit():
                     title = title.split(".", 1)[1].strip()
                     
-                current_task["title"] = title
+                # Plain dicts with every field present, so nothing needs filling in later
+                current_task = Task(
+                    section=section,
+                    title=title,
+                    complexity="Medium",
+                    dependencies=[],
+                    description="",
+                    technical_notes="",
+                    testing_notes=""
+                )
                 
-                # Process the rest of the lines
-                for line in lines[1:]:
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    # Look for complexity, dependencies, etc.
-                    if "complexity" in line.lower():
-                        complexity = line.split(":", 1)[1].strip() if ":" in line else "Medium"
-                        current_task["complexity"] = complexity
-                    elif "dependencies" in line.lower():
-                        deps = line.split(":", 1)[1].strip() if ":" in line else ""
-                        current_task["dependencies"] = [d.strip() for d in deps.split(",") if d.strip()]
-                    elif "description" in line.lower():
-                        desc = line.split(":", 1)[1].strip() if ":" in line else line
-                        current_task["description"] = desc
-                    elif "technical" in line.lower() and "notes" in line.lower():
-                        tech = line.split(":", 1)[1].strip() if ":" in line else line
-                        current_task["technical_notes"] = tech
-                    elif "testing" in line.lower() and "notes" in line.lower():
-                        test = line.split(":", 1)[1].strip() if ":" in line else line
-                        current_task["testing_notes"] = test
-            elif "title" in current_task:
+                # Process the labelled fields on the remaining lines
+                for match in _TASK_FIELD_RE.finditer(block, len(title_line)):
+                    self._set_task_field(current_task, match.group(1), match.group(2), match.group(0).strip())
+            elif current_task is not None:
                 # This is a continuation of a field from the current task
-                if "complexity" in block.lower():
-                    complexity = block.split(":", 1)[1].strip() if ":" in block else "Medium"
-                    current_task["complexity"] = complexity
-                elif "dependencies" in block.lower():
-                    deps = block.split(":", 1)[1].strip() if ":" in block else ""
-                    current_task["dependencies"] = [d.strip() for d in deps.split(",") if d.strip()]
-                elif "description" in block.lower():
-                    desc = block.split(":", 1)[1].strip() if ":" in block else block
-                    current_task["description"] = desc
-                elif "technical" in block.lower() and "notes" in block.lower():
-                    tech = block.split(":", 1)[1].strip() if ":" in block else block
-                    current_task["technical_notes"] = tech
-                elif "testing" in block.lower() and "notes" in block.lower():
-                    test = block.split(":", 1)[1].strip() if ":" in block else block
-                    current_task["testing_notes"] = test
+                match = _TASK_FIELD_RE.match(block)
+                if match:
+                    # The value runs to the end of the block, not just the label's line
+                    value = block[match.start(2):].strip() if match.group(2) is not None else None
+                    self._set_task_field(current_task, match.group(1), value, block)
                 else:
                     # If we can't identify the field, assume it's a description
-                    current_task["description"] = current_task.get("description", "") + "\n" + block
+                    current_task["description"] += "\n" + block
         
         # Add the last task if there is one
-        if "title" in current_task:
+        if current_task is not None:
             tasks.append(current_task)
             
-        # Ensure all tasks have the required fields
         for task in tasks:
-            task.setdefault("title", "Untitled Task")
-            task.setdefault("complexity", "Medium")
-            task.setdefault("dependencies", [])
-            task.setdefault("description", "No description provided.")
-            task.setdefault("technical_notes", "")
-            task.setdefault("testing_notes", "")
-            
-        return tasks
\ No newline at end of file
+            if not task["description"]:
+                task["description"] = "No description provided."
+            
+        return tasks
+    
+    def _set_task_field(self, task: Task, label: str, value: Optional[str], fallback: str) -> None:
+        """
+        Store a parsed field on a task.
+        
+        Args:
+            task (Task): The task being built
+            label (str): The field label as written in the response
+            value (Optional[str]): The text after the label's colon, or None if it had no colon
+            fallback (str): The text to use for free-text fields when there is no colon
+        """
+        key = _TASK_FIELD_KEYS["".join(label.lower().split())]
+        if key == "complexity":
+            value = value.strip() if value is not None else "Medium"
+        elif key == "dependencies":
+            value = [d.strip() for d in (value or "").split(",") if d.strip()]
+        else:
+            value = value.strip() if value is not None else fallback
+        task[key] = value
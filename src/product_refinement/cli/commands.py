@@ -1,18 +1,20 @@
 """Command line interface for the product refinement tool."""
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import json
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from ..ai.service import AIService
 from ..utils.config import Config
 from ..utils.display import (
     display_banner,
@@ -21,59 +23,206 @@ from ..utils.display import (
     display_success,
     display_warning,
     format_spec_as_markdown,
-    ask_user
+    ask_user,
+    ask_user_async,
+    spinner
 )
 from ..utils.storage import SpecificationManager
+from ..utils.types import AnsweredQuestion
 from ..utils.validation import Validator, ValidationError
 
+# The AI service (and the model SDKs it loads), asyncio and rich's live displays are
+# imported by the commands that use them, so `list` starts without them
+if TYPE_CHECKING:
+    from ..ai.service import AIService
+
 console = Console()
 
 def initialize_logging(config: Config) -> None:
-    """Initialize logging configuration."""
+    """Initialize logging configuration.
+    
+    File records are handed to a queue and written by a background listener, so
+    log file writes never block the command or its AI calls. Console records
+    stay synchronous so they keep their place among the rich output.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        # Already configured, as logging.basicConfig would leave it
+        return
+    
     # Create log directory if it doesn't exist
     os.makedirs(config.LOG_DIR, exist_ok=True)
     
     # Set httpx logger to WARNING level to suppress INFO messages
     logging.getLogger('httpx').setLevel(logging.WARNING)
     
-    logging.basicConfig(
-        level=config.LOG_LEVEL,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(os.path.join(config.LOG_DIR, 'product_refinement.log')),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(os.path.join(config.LOG_DIR, 'product_refinement.log'))
+    file_handler.setFormatter(formatter)
+    # File records are written in batches, and at once for errors; logging's own
+    # exit hook flushes what is left after the listener below has drained
+    buffered_file_handler = logging.handlers.MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, buffered_file_handler, respect_handler_level=True)
+    listener.start()
+    # Stopping the listener flushes queued records before the process exits
+    atexit.register(listener.stop)
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    root.setLevel(config.LOG_LEVEL)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.addHandler(stream_handler)
 
-def get_available_document_types(config: Config) -> List[Tuple[str, str]]:
+def _show_streamed_markdown(chunks: Iterator[str]) -> str:
     """
-    Get a list of available document types from the prompts directory.
+    Render streamed Markdown live as it arrives.
+    
+    The live view is transient; callers print the finished document afterwards so long
+    output is not left cropped to the terminal height.
     
     Args:
-        config (Config): The configuration object
+        chunks (Iterator[str]): The text chunks to display
         
     Returns:
-        List[Tuple[str, str]]: List of tuples with (doc_type, display_name)
+        str: The complete text
     """
-    doc_types = []
+    from rich.live import Live
+    from rich.markdown import Markdown
+    parts = []
+    last_render = 0.0
+    with Live(console=console, refresh_per_second=10, transient=True, vertical_overflow="crop") as live:
+        for chunk in chunks:
+            parts.append(chunk)
+            # Re-parsing the Markdown on every token would dominate, so re-render at the refresh rate.
+            # Partial documents are never shown twice, so they bypass format_spec_as_markdown's cache
+            now = time.monotonic()
+            if now - last_render >= 0.1:
+                live.update(Markdown("".join(parts)))
+                last_render = now
+    return "".join(parts).strip()
+
+async def _refine_spec(
+    ai_service: "AIService",
+    spec: str,
+    doc_type_display: str,
+    ask_to_continue: bool = False
+) -> str:
+    """
+    Refine a specification through rounds of follow-up questions.
     
-    try:
-        # List all directories in the prompts directory
-        prompt_dir = config.PROMPT_DIR
-        for item in os.listdir(prompt_dir):
-            potential_doc_type_dir = os.path.join(prompt_dir, item)
+    Args:
+        ai_service (AIService): The service making the AI calls
+        spec (str): The specification to refine
+        doc_type_display (str): Document type name shown with each update
+        ask_to_continue (bool): Ask whether to keep refining after each round
+        
+    Returns:
+        str: The refined specification
+    """
+    answered_questions: List[AnsweredQuestion] = []
+    answered_questions_text = ""  # Prompt history, extended as answers arrive
+    
+    while True:
+        # Get follow-up questions
+        with spinner("Generating follow-up questions..."):
+            questions = await ai_service.get_follow_up_questions_async(spec, answered_questions_text)
+        
+        if not questions:
+            break
+        
+        # Start updating the document while the user answers
+        ai_service.prefetch(ai_service.finalize_spec, spec)
+        answered_before = len(answered_questions)
+        
+        # Ask each question
+        current_section = None
+        for question in questions:
+            # Consecutive questions usually share a section; show its header once
+            if question['section'] != current_section:
+                current_section = question['section']
+                display_info(f"\n📋 Section: {current_section}")
+            while True:
+                answer = await ask_user_async(f"{question['question']} (type 'skip' to skip, 'done' to finish)")
+                
+                if answer.lower() == 'done':
+                    questions = []  # Clear remaining questions
+                    break
+                elif answer.lower() == 'skip':
+                    break
+                
+                try:
+                    Validator.not_empty(answer)
+                    answered_questions.append(AnsweredQuestion(question['section'], question['question'], answer))
+                    entry = f"Q: {question['question']}\nA: {answer}"
+                    answered_questions_text = f"{answered_questions_text}\n{entry}" if answered_questions_text else entry
+                    break
+                except ValidationError as e:
+                    display_error(str(e))
+        
+        if not questions:  # User typed 'done' or no more questions
+            break
+        
+        if len(answered_questions) == answered_before:
+            # Every question was skipped: the document would not change and the
+            # next round would ask the same questions again
+            break
+        
+        # Update specification with answers
+        with spinner("Updating document..."):
+            spec = await ai_service.finalize_spec_async(spec)
+        
+        # Display updated specification
+        console.print(f"\n📝 Updated {doc_type_display}:")
+        console.print(format_spec_as_markdown(spec))
+        
+        if ask_to_continue:
+            # Generate the next round of questions while the user decides
+            ai_service.prefetch(ai_service.get_follow_up_questions, spec, answered_questions_text)
             
+            # Ask if user wants to continue refining
+            if not (await ask_user_async("\nWould you like to continue refining? (yes/no)")).lower().startswith('y'):
+                break
+    
+    return spec
+
+def _read_doc_type_description(init_file: str) -> str:
+    """Return the first line of a document type package's docstring."""
+    try:
+        with open(init_file, 'r') as f:
+            content = f.read()
+        if '"""' in content:
+            return content.split('"""')[1].strip().split('\n')[0]
+    except Exception:
+        pass
+    return "No description available"
+
+def _scan_document_types(prompt_dir: str) -> List[Tuple[str, str, str]]:
+    """
+    Find the document types in a prompts directory, with their descriptions.
+    
+    Args:
+        prompt_dir (str): The prompts directory
+        
+    Returns:
+        List[Tuple[str, str, str]]: Sorted (doc_type, display_name, description) tuples
+    """
+    doc_types = []
+    with os.scandir(prompt_dir) as entries:
+        for entry in entries:
             # Check if it's a directory and has the necessary files
-            if (os.path.isdir(potential_doc_type_dir) and 
-                not item.startswith('__') and 
-                os.path.exists(os.path.join(potential_doc_type_dir, "initial.txt"))):
+            if (entry.is_dir() and
+                not entry.name.startswith('__') and
+                os.path.exists(os.path.join(entry.path, "initial.txt"))):
                 # Create a display name by replacing underscores with spaces and capitalizing
-                display_name = item.replace('_', ' ').title()
-                doc_types.append((item, display_name))
-    except Exception as e:
-        logging.error(f"Error scanning for document types: {e}")
-        
-    return sorted(doc_types)
+                display_name = entry.name.replace('_', ' ').title()
+                description = _read_doc_type_description(os.path.join(entry.path, "__init__.py"))
+                doc_types.append((entry.name, display_name, description))
+    
+    doc_types.sort()
+    return doc_types
 
 def prompt_for_document_type(config: Config) -> str:
     """
@@ -88,7 +237,11 @@ def prompt_for_document_type(config: Config) -> str:
     Raises:
         click.Abort: If the user cancels the selection
     """
-    doc_types = get_available_document_types(config)
+    try:
+        doc_types = _scan_document_types(config.PROMPT_DIR)
+    except Exception as e:
+        logging.error(f"Error scanning for document types: {e}")
+        doc_types = []
     
     if not doc_types:
         display_error("No document types available in the prompts directory.")
@@ -100,19 +253,7 @@ def prompt_for_document_type(config: Config) -> str:
     table.add_column("Document Type", style="green")
     table.add_column("Description", style="yellow")
     
-    for i, (doc_type, display_name) in enumerate(doc_types, 1):
-        # Get description from the first line of the __init__.py docstring if available
-        description = "No description available"
-        init_file = os.path.join(config.PROMPT_DIR, doc_type, "__init__.py")
-        if os.path.exists(init_file):
-            try:
-                with open(init_file, 'r') as f:
-                    content = f.read()
-                    if '"""' in content:
-                        description = content.split('"""')[1].strip().split('\n')[0]
-            except Exception:
-                pass
-        
+    for i, (doc_type, display_name, description) in enumerate(doc_types, 1):
         table.add_row(str(i), display_name, description)
     
     console.print(table)
@@ -134,6 +275,11 @@ def prompt_for_document_type(config: Config) -> str:
 
 def create_spec(config: Config) -> None:
     """Create a new product specification."""
+    import asyncio
+    asyncio.run(create_spec_async(config))
+
+async def create_spec_async(config: Config) -> None:
+    """Create a new product specification, overlapping AI calls with user input."""
     # If document type not specified in config, prompt for it
     if not hasattr(config, 'DOCUMENT_TYPE_SELECTED') or not config.DOCUMENT_TYPE_SELECTED:
         try:
@@ -144,7 +290,12 @@ def create_spec(config: Config) -> None:
     display_banner(f"Create New {config.DOCUMENT_TYPE.replace('_', ' ').title()}")
     
     # Initialize AI service
+    from ..ai.service import AIService
     ai_service = AIService(config)
+    ai_service.prewarm()
+    
+    # One manager serves dependency lookups and the final save
+    spec_manager = SpecificationManager(config)
     
     # Check for dependencies
     dependencies = ai_service.get_document_dependencies()
@@ -161,31 +312,18 @@ def create_spec(config: Config) -> None:
             display_info(f"• Requires {source_field} from {source_type}")
             
             # We need to get the source document
-            spec_manager = SpecificationManager(config)
-            specs = spec_manager.list_specifications(doc_type=source_type)
+            all_specs = [spec for spec in spec_manager.iter_specifications(doc_type=source_type)]
             
-            if not specs:
+            if not all_specs:
                 display_error(f"No specifications found. Please create a {source_type} document first.")
                 return
-                
-            # Create a flat list of all specifications
-            all_specs = []
-            for project_dir, versions in specs.items():
-                for version in versions:
-                    all_specs.append({
-                        'path': os.path.join(project_dir, version['filename']),
-                        'project': project_dir,
-                        'version': version
-                    })
             
             # Display numbered list of specifications
             console.print("\nSelect a source document:")
+            menu = Table.grid(padding=(0, 1))
             for i, spec in enumerate(all_specs, 1):
-                console.print(
-                    f"{i}. {spec['project']} - "
-                    f"v{spec['version']['version']} "
-                    f"({spec['version']['formatted_timestamp']})"
-                )
+                menu.add_row(f"{i}.", spec['project'], f"v{spec['version']}", f"({spec['formatted_timestamp']})")
+            console.print(menu)
             
             # Get user selection
             while True:
@@ -236,97 +374,35 @@ def create_spec(config: Config) -> None:
             except ValidationError as e:
                 display_error(str(e))
     
-    # Generate initial specification
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        progress.add_task(description="Generating initial document...", total=None)
-        initial_spec = ai_service.generate_initial_spec(description, dependency_values)
+    # Generate initial specification, showing it as it streams in
+    console.print(f"\n📝 Initial {config.DOCUMENT_TYPE.replace('_', ' ').title()}:")
+    try:
+        initial_spec = _show_streamed_markdown(ai_service.stream_initial_spec(description, dependency_values))
+    except Exception as e:
+        # Fall back to the blocking call, which retries and offers another model
+        logging.warning(f"Streaming the initial document failed: {e}")
+        with spinner("Generating initial document..."):
+            initial_spec = await ai_service.generate_initial_spec_async(description, dependency_values)
     
     if initial_spec.startswith("Error"):
         display_error("Failed to generate initial document.")
         return
     
     # Display initial specification
-    console.print(f"\n📝 Initial {config.DOCUMENT_TYPE.replace('_', ' ').title()}:")
     console.print(format_spec_as_markdown(initial_spec))
     
     # Refine specification through questions
-    spec = initial_spec
-    answered_questions = []
-    
-    while True:
-        # Format answered questions for the prompt
-        answered_questions_text = "\n".join([
-            f"Q: {q['question']}\nA: {q['answer']}"
-            for q in answered_questions
-        ])
-        
-        # Get follow-up questions
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
-            progress.add_task(description="Generating follow-up questions...", total=None)
-            questions = ai_service.get_follow_up_questions(spec, answered_questions_text)
-        
-        if not questions:
-            break
-        
-        # Ask each question
-        for question in questions:
-            display_info(f"\n📋 Section: {question['section']}")
-            while True:
-                answer = ask_user(f"{question['question']} (type 'skip' to skip, 'done' to finish)")
-                
-                if answer.lower() == 'done':
-                    questions = []  # Clear remaining questions
-                    break
-                elif answer.lower() == 'skip':
-                    break
-                
-                try:
-                    Validator.not_empty(answer)
-                    answered_questions.append({
-                        'section': question['section'],
-                        'question': question['question'],
-                        'answer': answer
-                    })
-                    break
-                except ValidationError as e:
-                    display_error(str(e))
-        
-        if not questions:  # User typed 'done' or no more questions
-            break
-        
-        # Update specification with answers
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
-            progress.add_task(description="Updating document...", total=None)
-            spec = ai_service.finalize_spec(spec)
-        
-        # Display updated specification
-        console.print(f"\n📝 Updated {config.DOCUMENT_TYPE.replace('_', ' ').title()}:")
-        console.print(format_spec_as_markdown(spec))
+    spec = await _refine_spec(
+        ai_service, initial_spec,
+        config.DOCUMENT_TYPE.replace('_', ' ').title()
+    )
     
     # Get project name suggestion
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        progress.add_task(description="Suggesting project name...", total=None)
-        project_name = ai_service.suggest_project_name(spec)
+    with spinner("Suggesting project name..."):
+        project_name = await ai_service.suggest_project_name_async(spec)
     
     # Save specification
     try:
-        spec_manager = SpecificationManager(config)
         spec_manager.save_specification(project_name, spec, config.DOCUMENT_TYPE)
         display_success(f"\n✅ {config.DOCUMENT_TYPE.replace('_', ' ').title()} saved as '{project_name}'")
     except Exception as e:
@@ -370,6 +446,11 @@ def list_specs(config: Config, project: Optional[str] = None, doc_type: Optional
 
 def edit_spec(config: Config, spec_path: Optional[str] = None) -> None:
     """Edit an existing specification."""
+    import asyncio
+    asyncio.run(edit_spec_async(config, spec_path))
+
+async def edit_spec_async(config: Config, spec_path: Optional[str] = None) -> None:
+    """Edit an existing specification, overlapping AI calls with user input."""
     display_banner("Edit Document")
     
     try:
@@ -382,11 +463,13 @@ def edit_spec(config: Config, spec_path: Optional[str] = None) -> None:
             try:
                 # Get list of document types that have saved documents
                 available_types = []
+                seen_types = set()
                 all_specs = spec_manager.list_specifications()
                 
                 for project_dir, doc_types in all_specs.items():
                     for doc_type in doc_types.keys():
-                        if doc_type not in [t[0] for t in available_types]:
+                        if doc_type not in seen_types:
+                            seen_types.add(doc_type)
                             display_name = doc_type.replace('_', ' ').title()
                             available_types.append((doc_type, display_name))
                 
@@ -431,70 +514,74 @@ def edit_spec(config: Config, spec_path: Optional[str] = None) -> None:
         # If no spec_path provided, show selection menu
         if not spec_path:
             # Create a flat list of all specifications with their paths
+            # Project and document type names repeat across versions, so each is
+            # prettified once
             all_specs = []
-            for project_dir, doc_types in specs.items():
-                if selected_doc_type:
-                    # If document type is selected, only show that type
-                    if selected_doc_type in doc_types:
-                        for spec in doc_types[selected_doc_type]:
-                            doc_type_name = selected_doc_type.replace('_', ' ').title()
-                            all_specs.append({
-                                'path': os.path.join(project_dir, selected_doc_type, spec['filename']),
-                                'project': project_dir,
-                                'version': spec,
-                                'doc_type': selected_doc_type,
-                                'display_name': f"{project_dir.replace('_', ' ').title()} - {doc_type_name} v{spec['version']}"
-                            })
-                else:
-                    # If no document type selected, show all
-                    for doc_type, specs_list in doc_types.items():
-                        for spec in specs_list:
-                            doc_type_name = doc_type.replace('_', ' ').title()
-                            all_specs.append({
-                                'path': os.path.join(project_dir, doc_type, spec['filename']),
-                                'project': project_dir,
-                                'version': spec,
-                                'doc_type': doc_type,
-                                'display_name': f"{project_dir.replace('_', ' ').title()} - {doc_type_name} v{spec['version']}"
-                            })
+            pretty_names: Dict[str, str] = {}
+            for spec in spec_manager.iter_specifications(doc_type=selected_doc_type):
+                for name in (spec['project'], spec['doc_type']):
+                    if name not in pretty_names:
+                        pretty_names[name] = name.replace('_', ' ').title()
+                spec['display_name'] = (
+                    f"{pretty_names[spec['project']]} - {pretty_names[spec['doc_type']]} v{spec['version']}"
+                )
+                all_specs.append(spec)
             
             if not all_specs:
                 display_info("No documents found.")
                 return
             
             # Sort by project name and then by timestamp (newest first)
-            all_specs.sort(key=lambda x: (x['project'], -x['version'].get('timestamp', 0)))
-            
-            # Display numbered list of specifications
-            console.print("\nAvailable documents:")
-            for i, spec in enumerate(all_specs, 1):
-                console.print(
-                    f"{i}. {spec['display_name']} "
-                    f"({spec['version'].get('formatted_timestamp', 'Unknown date')})"
-                )
+            all_specs.sort(key=lambda x: (x['project'], -x.get('timestamp', 0)))
             
-            # Get user selection
+            # Display numbered list of specifications; typing text instead of a
+            # number narrows the list so only the matches are shown again
+            candidates = all_specs
+            show_list = True
             while True:
-                try:
-                    selection = ask_user("\nEnter the number of the document to edit (or 'q' to quit):")
-                    if selection.lower() == 'q':
-                        return
-                    
+                if show_list:
+                    console.print("\nAvailable documents:")
+                    menu = Table.grid(padding=(0, 1))
+                    for i, spec in enumerate(candidates, 1):
+                        menu.add_row(f"{i}.", spec['display_name'], f"({spec.get('formatted_timestamp', 'Unknown date')})")
+                    console.print(menu)
+                    show_list = False
+                
+                selection = ask_user(
+                    "\nEnter the number of the document to edit, text to filter the list, "
+                    "or 'q' to quit:"
+                ).strip()
+                if selection.lower() == 'q':
+                    return
+                
+                if selection.isdigit():
                     index = int(selection) - 1
-                    if 0 <= index < len(all_specs):
-                        spec_path = all_specs[index]['path']
+                    if 0 <= index < len(candidates):
+                        spec_path = candidates[index]['path']
                         # Set the document type for the editing session
-                        config.DOCUMENT_TYPE = all_specs[index]['doc_type']
+                        config.DOCUMENT_TYPE = candidates[index]['doc_type']
                         break
-                    else:
-                        display_error("Invalid selection. Please try again.")
-                except ValueError:
-                    display_error("Please enter a valid number.")
+                    display_error("Invalid selection. Please try again.")
+                    continue
+                
+                query = selection.lower()
+                matches = [spec for spec in all_specs if query in spec['display_name'].lower()]
+                if not matches:
+                    display_error(f"No documents match '{selection}'.")
+                    continue
+                if len(matches) == 1:
+                    spec_path = matches[0]['path']
+                    config.DOCUMENT_TYPE = matches[0]['doc_type']
+                    display_info(f"Selected {matches[0]['display_name']}")
+                    break
+                candidates = matches
+                show_list = True
         
         else:
-            # Check if spec_path is a directory (project name)
-            full_dir_path = os.path.join(config.SPECS_DIR, spec_path)
-            if os.path.isdir(full_dir_path) and spec_path in specs:
+            # Check if spec_path is a project name; the listing only holds
+            # project directories, so no filesystem probe is needed
+            if spec_path in specs:
+                full_dir_path = os.path.join(config.SPECS_DIR, spec_path)
                 # If document type is selected, use that
                 if selected_doc_type and selected_doc_type in specs[spec_path]:
                     versions = specs[spec_path][selected_doc_type]
@@ -504,8 +591,8 @@ def edit_spec(config: Config, spec_path: Optional[str] = None) -> None:
                     doc_type, versions = next(iter(specs[spec_path].items()))
                 
                 if versions:
-                    # Sort by version number (descending) and take the first one
-                    latest_version = sorted(versions, key=lambda v: v['version'], reverse=True)[0]
+                    # Take the highest version number
+                    latest_version = max(versions, key=lambda v: v['version'])
                     spec_path = os.path.join(full_dir_path, doc_type, latest_version['filename'])
                     config.DOCUMENT_TYPE = doc_type
                     display_info(f"Using latest version: {latest_version['filename']}")
@@ -524,80 +611,24 @@ def edit_spec(config: Config, spec_path: Optional[str] = None) -> None:
         console.print(f"\n📝 Current {doc_type_display}:")
         console.print(format_spec_as_markdown(spec_data['specification']))
         
+        # Initialize AI service with the correct document type, loading the
+        # model while the user decides whether to edit
+        config.DOCUMENT_TYPE = spec_data.get('doc_type', config.DOCUMENT_TYPE)
+        from ..ai.service import AIService
+        ai_service = AIService(config)
+        ai_service.prewarm()
+        
         # Ask for confirmation
         if not ask_user("\nWould you like to edit this document? (yes/no)").lower().startswith('y'):
             display_info("Edit cancelled.")
             return
         
-        # Initialize AI service with the correct document type
-        config.DOCUMENT_TYPE = spec_data.get('doc_type', config.DOCUMENT_TYPE)
-        ai_service = AIService(config)
         
         # Start refinement process
-        spec = spec_data['specification']
-        answered_questions = []
-        
-        while True:
-            # Format answered questions for the prompt
-            answered_questions_text = "\n".join([
-                f"Q: {q['question']}\nA: {q['answer']}"
-                for q in answered_questions
-            ])
-            
-            # Get follow-up questions
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True,
-            ) as progress:
-                progress.add_task(description="Generating follow-up questions...", total=None)
-                questions = ai_service.get_follow_up_questions(spec, answered_questions_text)
-            
-            if not questions:
-                break
-            
-            # Ask each question
-            for question in questions:
-                display_info(f"\n📋 Section: {question['section']}")
-                while True:
-                    answer = ask_user(f"{question['question']} (type 'skip' to skip, 'done' to finish)")
-                    
-                    if answer.lower() == 'done':
-                        questions = []  # Clear remaining questions
-                        break
-                    elif answer.lower() == 'skip':
-                        break
-                    
-                    try:
-                        Validator.not_empty(answer)
-                        answered_questions.append({
-                            'section': question['section'],
-                            'question': question['question'],
-                            'answer': answer
-                        })
-                        break
-                    except ValidationError as e:
-                        display_error(str(e))
-            
-            if not questions:  # User typed 'done' or no more questions
-                break
-            
-            # Update specification with answers
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True,
-            ) as progress:
-                progress.add_task(description="Updating document...", total=None)
-                spec = ai_service.finalize_spec(spec)
-            
-            # Display updated specification
-            console.print(f"\n📝 Updated {doc_type_display}:")
-            console.print(format_spec_as_markdown(spec))
-            
-            # Ask if user wants to continue refining
-            if not ask_user("\nWould you like to continue refining? (yes/no)").lower().startswith('y'):
-                break
+        spec = await _refine_spec(
+            ai_service, spec_data['specification'], doc_type_display,
+            ask_to_continue=True
+        )
         
         # Show final preview and ask for confirmation
         console.print(f"\n📝 Final {doc_type_display}:")
@@ -615,12 +646,54 @@ def edit_spec(config: Config, spec_path: Optional[str] = None) -> None:
     except Exception as e:
         display_error(f"Failed to edit document: {str(e)}")
 
+def todo_spec(config: Config, spec_path: str) -> None:
+    """Generate an engineering todo list from a saved specification."""
+    display_banner("Engineering Todo List")
+    
+    try:
+        spec_manager = SpecificationManager(config)
+        spec_data = spec_manager.load_specification(spec_path)
+        if not spec_data:
+            display_error(f"Document not found: {spec_path}")
+            return
+        
+        from ..ai.service import AIService
+        ai_service = AIService(config)
+        
+        with spinner("Generating todo list..."):
+            todo_list = ai_service.generate_todo_list(spec_data['specification'])
+        
+        tasks = todo_list['tasks']
+        if not tasks:
+            display_error("No tasks were generated.")
+            return
+        
+        # Display the tasks in a table, in section order
+        table = Table(title=f"Engineering Todo List: {spec_data.get('product_name', 'Unknown')}")
+        table.add_column("Section", style="cyan")
+        table.add_column("Task", style="green")
+        table.add_column("Complexity", style="yellow")
+        table.add_column("Dependencies")
+        for task in tasks:
+            table.add_row(task['section'], task['title'], task['complexity'], ", ".join(task['dependencies']) or "-")
+        console.print(table)
+        
+        if ask_user("\nWould you like to save the todo list as a JSON file? (yes/no)").lower().startswith('y'):
+            todo_path = spec_manager.save_todo_list(spec_path, todo_list)
+            display_success(f"\n✅ Todo list saved to {todo_path}")
+        else:
+            display_info("Todo list not saved.")
+            
+    except Exception as e:
+        display_error(f"Failed to generate todo list: {str(e)}")
+
 @click.group()
 @click.option('--model', help='AI model to use')
 @click.option('--log-level', help='Logging level (DEBUG, INFO, WARNING, ERROR)')
 @click.option('--doc-type', help='Document type to work with (e.g., product_requirements, idea)')
+@click.option('--no-cache', is_flag=True, help='Always call the AI model instead of reusing cached responses')
 @click.pass_context
-def cli(ctx: click.Context, model: Optional[str], log_level: Optional[str], doc_type: Optional[str]) -> None:
+def cli(ctx: click.Context, model: Optional[str], log_level: Optional[str], doc_type: Optional[str], no_cache: bool) -> None:
     """Product Refinement Tool - Generate and refine product specifications using AI."""
     # Initialize configuration
     config = Config()
@@ -633,6 +706,8 @@ def cli(ctx: click.Context, model: Optional[str], log_level: Optional[str], doc_
     if doc_type:
         config.DOCUMENT_TYPE = doc_type
         config.DOCUMENT_TYPE_SELECTED = True  # Flag that user explicitly selected a doc type
+    if no_cache:
+        config.CACHE_ENABLED = False
     
     # Initialize logging
     initialize_logging(config)
@@ -664,5 +739,12 @@ def edit(config: Config, spec_path: Optional[str]) -> None:
     """Edit an existing document."""
     edit_spec(config, spec_path)
 
+@cli.command()
+@click.argument('spec_path')
+@click.pass_obj
+def todo(config: Config, spec_path: str) -> None:
+    """Generate an engineering todo list from an existing document."""
+    todo_spec(config, spec_path)
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
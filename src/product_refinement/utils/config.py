@@ -1,5 +1,6 @@
 """Configuration settings for the product refinement system."""
 import os
+from typing import Dict
 
 class Config:
     """Application configuration settings."""
@@ -21,7 +22,17 @@ class Config:
     CACHE_DIR: str = os.path.join(_DATA_ROOT, "cache")
     LOG_DIR: str = os.path.join(_DATA_ROOT, "logs")
     
+    # Reuse AI responses for identical calls; PRODUCT_REFINEMENT_CACHE=0 turns this off
+    CACHE_ENABLED: bool = os.environ.get("PRODUCT_REFINEMENT_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+    NORMALIZE_CACHE_KEYS: bool = True  # Ignore whitespace-only differences in cached call arguments
     CACHE_EXPIRY: int = 60 * 60 * 24 * 7  # 1 week in seconds
+    CACHE_TTLS: Dict[str, int] = {  # Per-method overrides of CACHE_EXPIRY, in seconds
+        "generate_initial_spec": 60 * 60 * 24,  # 1 day
+        "get_follow_up_questions": 60 * 60,  # 1 hour
+    }
+    CACHE_SIZE_LIMIT: int = 2 ** 30  # 1 GB, used by the diskcache backend
+    MEMORY_CACHE_SIZE: int = 128  # Responses kept in memory per AIService
+    MAX_CONCURRENT_REQUESTS: int = 8  # Upper bound on AI calls in flight at once
     DOCUMENT_TYPE: str = "product_requirements"  # Default document type
     
     def __init__(self):
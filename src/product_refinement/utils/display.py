@@ -1,26 +1,62 @@
 """Display utilities for the command line interface."""
-from typing import Any
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator
 
 # Add colorful output and progress indicators
 try:
     from rich.console import Console
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
     from rich.prompt import Prompt
     from rich.table import Table
-    from rich.markdown import Markdown
     RICH_AVAILABLE = True
     console = Console()
 except ImportError:
     RICH_AVAILABLE = False
     console = None
 
+# The spinner shared by every AI call, created on first use
+_progress = None
+
+# Markdown parses the whole document up front; the refinement loops redisplay
+# the same text whenever a round leaves the specification unchanged
+@lru_cache(maxsize=16)
 def format_spec_as_markdown(spec: str) -> Any:
     """Format specification as markdown if rich is available."""
     if RICH_AVAILABLE:
+        # Imported on first use: the Markdown parser is slow to import and not every command renders specs
+        from rich.markdown import Markdown
         return Markdown(spec)
     return spec
 
+@contextmanager
+def spinner(description: str) -> Iterator[None]:
+    """Show a spinner with the given description while the block runs."""
+    global _progress
+    if not RICH_AVAILABLE:
+        yield
+        return
+    
+    if _progress is None:
+        # Imported on first use, like the Markdown parser
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        _progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        )
+        _progress.add_task(description="", total=None)
+    
+    _progress.update(_progress.task_ids[0], description=description)
+    _progress.start()
+    try:
+        yield
+    finally:
+        # Stopped between calls so it never draws over a user prompt
+        _progress.stop()
+
 def display_banner(title: str) -> None:
     """Display a banner with the title."""
     if RICH_AVAILABLE:
@@ -37,6 +73,35 @@ def ask_user(prompt: str) -> str:
     else:
         return input(f"{prompt} ")
 
+async def ask_user_async(prompt: str) -> str:
+    """Ask user for input on a worker thread so the event loop keeps running."""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(result: Any, error: Any) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def read() -> None:
+        try:
+            outcome = (ask_user(prompt), None)
+        except BaseException as e:  # EOFError or KeyboardInterrupt from the prompt
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # The event loop already finished; nobody is waiting for this answer
+    
+    # A daemon thread rather than the default executor: if the command is interrupted
+    # while waiting for input, exiting must not block on the abandoned read
+    threading.Thread(target=read, name="ask-user", daemon=True).start()
+    return await future
+
 def display_success(message: str) -> None:
     """Display a success message."""
     if RICH_AVAILABLE:
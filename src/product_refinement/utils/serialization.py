@@ -0,0 +1,47 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+import json
+from typing import Any, Union
+
+# Use orjson when it is installed; it is considerably faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data (Union[str, bytes]): The JSON text to parse
+
+    Returns:
+        Any: The parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj (Any): The object to serialize
+        indent (bool): Pretty-print with two-space indentation, for files people read
+
+    Returns:
+        bytes: The JSON document
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
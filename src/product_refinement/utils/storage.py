@@ -4,11 +4,44 @@ import logging
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, Optional, Any, Tuple
 
+from . import serialization
 from .config import Config
 from .types import SpecificationData, SpecificationVersion
 
+# Listing metadata keyed by file path, validated against (st_mtime_ns, st_size)
+# so unchanged specification files are not re-read and re-parsed
+_METADATA_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _write_json_atomically(path: str, obj: Any) -> None:
+    """
+    Write obj as indented JSON via a temporary file renamed into place.
+
+    A crash mid-write never leaves a truncated file behind, and the temporary
+    file is removed if the write fails.
+
+    Args:
+        path (str): Destination file path
+        obj (Any): JSON-serializable object to write
+
+    Raises:
+        IOError: If the file cannot be written
+    """
+    data = serialization.dumps(obj, indent=True)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except IOError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 class SpecificationManager:
     """Manages saving and loading of product specifications."""
     
@@ -63,8 +96,8 @@ class SpecificationManager:
                     
                 try:
                     # Load the specification
-                    with open(file_path, 'r') as f:
-                        spec_data = json.load(f)
+                    with open(file_path, 'rb') as f:
+                        spec_data = serialization.loads(f.read())
                     
                     # Determine document type
                     if doc_type is None:
@@ -103,8 +136,7 @@ class SpecificationManager:
                     
                     # If target doesn't exist or is different, save the updated specification
                     if not os.path.exists(new_file_path) or file_path != new_file_path:
-                        with open(new_file_path, 'w') as f:
-                            json.dump(spec_data, f, indent=2)
+                        _write_json_atomically(new_file_path, spec_data)
                         logging.info(f"Migrated specification from {file_path} to {new_file_path}")
                         
                         # Only note removal for files that aren't in the same location
@@ -182,9 +214,7 @@ class SpecificationManager:
             if versions:
                 version = max(versions) + 1
         
-        # Generate filename with timestamp and version
-        timestamp = datetime.now()
-        formatted_timestamp = timestamp.strftime('%Y%m%d_%H%M%S')
+        # Generate filename with version
         filename = f"{project_name.lower().replace(' ', '_')}_v{version}.json"
         
         spec_path = os.path.join(doc_type_dir, filename)
@@ -222,15 +252,71 @@ class SpecificationManager:
             'doc_type': doc_type
         }
         
+        # Write to a temporary file renamed into place, so a crash mid-write
+        # never leaves a truncated specification behind
         try:
-            with open(spec_path, 'w') as f:
-                json.dump(spec_dict, f, indent=2)
+            _write_json_atomically(spec_path, spec_dict)
             logging.info(f"Saved specification to {spec_path}")
             return spec_path
         except IOError as e:
             logging.error(f"Failed to save specification: {e}")
             raise
     
+    def save_todo_list(self, spec_path: str, todo_list: Dict[str, Any]) -> str:
+        """
+        Save an engineering todo list next to the specification it was generated from.
+        
+        Args:
+            spec_path (str): Path to the specification file, absolute or relative to SPECS_DIR
+            todo_list (Dict[str, Any]): The todo list, as returned by AIService.generate_todo_list
+            
+        Returns:
+            str: Path where the todo list was saved
+            
+        Raises:
+            IOError: If the todo list cannot be saved
+        """
+        if not os.path.isabs(spec_path):
+            spec_path = os.path.join(self.config.SPECS_DIR, spec_path)
+        
+        # The _todo suffix keeps the file out of version numbering and listings
+        todo_path = os.path.splitext(spec_path)[0] + "_todo.json"
+        try:
+            _write_json_atomically(todo_path, todo_list)
+            logging.info(f"Saved todo list to {todo_path}")
+            return todo_path
+        except IOError as e:
+            logging.error(f"Failed to save todo list: {e}")
+            raise
+    
+    def _read_metadata(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read the listing metadata of a specification file.
+        
+        The specification body is dropped so listings never hold full documents
+        in memory; it is only read by load_specification once a file is chosen.
+        
+        Args:
+            file_path (str): Path to the specification file
+            
+        Returns:
+            Dict[str, Any]: The specification's fields, excluding the specification text
+            
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        st = os.stat(file_path)
+        cached = _METADATA_CACHE.get(file_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        with open(file_path, 'rb') as f:
+            spec_data = serialization.loads(f.read())
+        spec_data.pop('specification', None)
+        
+        _METADATA_CACHE[file_path] = (st.st_mtime_ns, st.st_size, spec_data)
+        return spec_data
+    
     def list_specifications(self, project_name: str = None, doc_type: str = None) -> Dict:
         """
         List specifications, filtered by project and/or document type.
@@ -244,15 +330,18 @@ class SpecificationManager:
         """
         result = {}
         
-        # Get all projects
+        # Get all projects; scandir entries know their type without a stat per name
         try:
-            for project_dir in os.listdir(self.config.SPECS_DIR):
-                project_path = os.path.join(self.config.SPECS_DIR, project_dir)
+            with os.scandir(self.config.SPECS_DIR) as projects:
+                project_entries = [
+                    entry for entry in projects
+                    # Skip non-directories and system directories
+                    if entry.is_dir() and not entry.name.startswith(('.', '__'))
+                ]
+            
+            for project_entry in project_entries:
+                project_dir = project_entry.name
                 
-                # Skip non-directories and system directories
-                if not os.path.isdir(project_path) or project_dir.startswith('.') or project_dir.startswith('__'):
-                    continue
-                    
                 # Filter by project name if specified
                 if project_name and project_dir != project_name.lower().replace(' ', '_'):
                     continue
@@ -260,12 +349,14 @@ class SpecificationManager:
                 project_specs = {}
                 
                 # Look for document type folders in this project
-                for doc_type_dir in os.listdir(project_path):
-                    doc_type_path = os.path.join(project_path, doc_type_dir)
-                    
-                    # Skip non-directories and system directories
-                    if not os.path.isdir(doc_type_path) or doc_type_dir.startswith('.') or doc_type_dir.startswith('__'):
-                        continue
+                with os.scandir(project_entry.path) as doc_types:
+                    doc_type_entries = [
+                        entry for entry in doc_types
+                        if entry.is_dir() and not entry.name.startswith(('.', '__'))
+                    ]
+                
+                for doc_type_entry in doc_type_entries:
+                    doc_type_dir = doc_type_entry.name
                     
                     # Filter by document type if specified
                     if doc_type and doc_type_dir != doc_type:
@@ -273,7 +364,9 @@ class SpecificationManager:
                     
                     # List specification files in this document type
                     spec_files = []
-                    for filename in os.listdir(doc_type_path):
+                    with os.scandir(doc_type_entry.path) as files:
+                        filenames = [entry.name for entry in files]
+                    for filename in filenames:
                         # Only include JSON files
                         if not filename.endswith('.json'):
                             continue
@@ -282,18 +375,16 @@ class SpecificationManager:
                         if filename.endswith('_todo.json') and doc_type_dir != 'engineering_todo':
                             continue
                             
-                        file_path = os.path.join(doc_type_path, filename)
+                        file_path = os.path.join(doc_type_entry.path, filename)
                         try:
-                            with open(file_path, 'r') as f:
-                                spec_data = json.load(f)
-                                
+                            metadata = self._read_metadata(file_path)
                             spec_files.append({
                                 'filename': filename,
                                 'path': os.path.join(project_dir, doc_type_dir, filename),
-                                'version': spec_data.get('version', 1),
-                                'timestamp': spec_data.get('timestamp', 0),
-                                'formatted_timestamp': spec_data.get('formatted_timestamp', 'Unknown date'),
-                                'product_name': spec_data.get('product_name', project_dir.replace('_', ' ')),
+                                'version': metadata.get('version', 1),
+                                'timestamp': metadata.get('timestamp', 0),
+                                'formatted_timestamp': metadata.get('formatted_timestamp', 'Unknown date'),
+                                'product_name': metadata.get('product_name', project_dir.replace('_', ' ')),
                                 'doc_type': doc_type_dir  # Use directory name for clarity
                             })
                         except (json.JSONDecodeError, KeyError) as e:
@@ -308,18 +399,29 @@ class SpecificationManager:
                 # Only add projects with specifications
                 if project_specs:
                     result[project_dir] = project_specs
-            
-            # For specific document type queries, simplify the result structure
-            if doc_type and len(result) == 1:
-                project = next(iter(result))
-                if doc_type in result[project]:
-                    return result[project][doc_type]
         except Exception as e:
             logging.error(f"Failed to list specifications: {e}")
             raise
                 
         return result
     
+    def iter_specifications(self, project_name: str = None, doc_type: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over specifications as flat entries, for selection menus.
+        
+        Args:
+            project_name (str, optional): Filter by project name.
+            doc_type (str, optional): Filter by document type.
+        
+        Yields:
+            Dict[str, Any]: A specification's listing entry plus its 'project' directory name
+        """
+        for project_dir, doc_types in self.list_specifications(project_name, doc_type).items():
+            for specs in doc_types.values():
+                for spec in specs:
+                    spec['project'] = project_dir
+                    yield spec
+    
     def load_specification(self, spec_path: str) -> Optional[SpecificationData]:
         """
         Load a specification from file.
@@ -340,8 +442,8 @@ class SpecificationManager:
             full_path = spec_path
         
         try:
-            with open(full_path, 'r') as f:
-                spec_data = json.load(f)
+            with open(full_path, 'rb') as f:
+                spec_data = serialization.loads(f.read())
                 
             # Add the doc_type if it's not already there
             if 'doc_type' not in spec_data:
@@ -1,13 +1,15 @@
 """Type definitions for the product refinement system."""
-from typing import TypedDict, List
+from typing import NamedTuple, TypedDict, List
 
 class Question(TypedDict):
     """Represents a question generated by the AI."""
     section: str
     question: str
 
-class AnsweredQuestion(Question):
+class AnsweredQuestion(NamedTuple):
     """Represents a question that has been answered by the user."""
+    section: str
+    question: str
     answer: str
 
 class SpecificationVersion(TypedDict):
@@ -31,4 +33,14 @@ class DocumentDependency(TypedDict):
     """Defines a dependency between document types."""
     source_type: str      # The document type this depends on
     source_field: str     # The field needed from the source document
-    placeholder: str      # The placeholder in the prompt to be replaced
\ No newline at end of file
+    placeholder: str      # The placeholder in the prompt to be replaced
+
+class Task(TypedDict):
+    """Represents an engineering task parsed from an AI-generated todo list."""
+    section: str
+    title: str
+    complexity: str
+    dependencies: List[str]
+    description: str
+    technical_notes: str
+    testing_notes: str
@@ -0,0 +1,91 @@
+"""Shared test fixtures.
+
+The llm library is only needed to reach a real model. When it is not
+installed, a bare module stands in for it so the service can be imported;
+tests install a fake model through llm.get_model either way.
+"""
+import sys
+import threading
+import types
+from typing import Callable, Iterator, List, Optional
+
+import pytest
+
+try:
+    import llm
+except ImportError:
+    llm = types.ModuleType("llm")
+
+    def _get_model(name):
+        raise RuntimeError("llm is not installed")
+
+    llm.get_model = _get_model
+    sys.modules["llm"] = llm
+
+from product_refinement.ai import service as service_module
+from product_refinement.utils.config import Config
+
+
+class FakeResponse:
+    """A response as returned by an llm model's prompt method."""
+
+    def __init__(self, text: str):
+        self._text = text
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(0, len(self._text), 8):
+            yield self._text[i:i + 8]
+
+    def text(self) -> str:
+        return self._text
+
+
+class FakeModel:
+    """Answers prompts through a reply function and records every prompt it was sent."""
+
+    def __init__(self, reply: Callable[[str], str]):
+        self.reply = reply
+        self.prompts: List[str] = []
+        self._lock = threading.Lock()
+
+    def prompt(self, prompt: str, stream: bool = True, system: Optional[str] = None) -> FakeResponse:
+        with self._lock:
+            self.prompts.append(prompt)
+        return FakeResponse(self.reply(prompt))
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """A Config whose specs, cache and log directories live under tmp_path."""
+    monkeypatch.setattr(Config, "SPECS_DIR", str(tmp_path / "specs"))
+    monkeypatch.setattr(Config, "CACHE_DIR", str(tmp_path / "specs" / "cache"))
+    monkeypatch.setattr(Config, "LOG_DIR", str(tmp_path / "specs" / "logs"))
+    monkeypatch.setattr(Config, "CACHE_ENABLED", True)
+    return Config()
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Install a FakeModel as every model llm.get_model returns."""
+    model = FakeModel(lambda prompt: "# Spec\n\nA generated specification.")
+    monkeypatch.setattr(service_module.llm, "get_model", lambda name: model)
+    return model
+
+
+@pytest.fixture(params=["file", "diskcache"])
+def cache_backend(request, monkeypatch):
+    """Run a test against the gzipped-file and the diskcache response caches."""
+    if request.param == "diskcache":
+        pytest.importorskip("diskcache")
+        monkeypatch.setattr(service_module, "DISKCACHE_AVAILABLE", True)
+    else:
+        monkeypatch.setattr(service_module, "DISKCACHE_AVAILABLE", False)
+    return request.param
+
+
+@pytest.fixture
+def drain_cache_writes():
+    """Return a function that waits for the disk cache writes submitted so far."""
+    def drain() -> None:
+        service_module._CACHE_IO_POOL.submit(lambda: None).result()
+    return drain
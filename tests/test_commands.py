@@ -0,0 +1,35 @@
+"""Tests for the command line interface."""
+import json
+import os
+
+from click.testing import CliRunner
+
+from product_refinement.cli.commands import cli
+from product_refinement.utils.storage import SpecificationManager
+
+
+TASKS_REPLY = "1. Set up the service\nComplexity: Low\n\n2. Add metrics\nComplexity: High"
+
+
+def test_todo_command_saves_the_todo_list_next_to_the_spec(config, fake_model):
+    fake_model.reply = lambda prompt: TASKS_REPLY
+    spec_path = SpecificationManager(config).save_specification("Widget Pro", "# Spec", "product_requirements")
+
+    result = CliRunner().invoke(cli, ["todo", spec_path], input="yes\n")
+
+    assert result.exit_code == 0, result.output
+    todo_path = spec_path[:-len(".json")] + "_todo.json"
+    with open(todo_path) as f:
+        tasks = json.load(f)["tasks"]
+    assert tasks[0]["title"] == "Set up the service"
+    assert len(tasks) == 14
+    # The todo file is neither a new version nor listed as a specification
+    listing = SpecificationManager(config).list_specifications()
+    assert [spec["filename"] for spec in listing["widget_pro"]["product_requirements"]] == ["widget_pro_v1.json"]
+
+
+def test_todo_command_reports_a_missing_spec(config, fake_model):
+    result = CliRunner().invoke(cli, ["todo", "missing/product_requirements/missing_v1.json"])
+    assert result.exit_code == 0
+    assert "Document not found" in result.output
+    assert not fake_model.prompts
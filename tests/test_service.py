@@ -0,0 +1,269 @@
+"""Tests for the AI service's caching, prefetching, retries and response parsing."""
+import os
+import threading
+import time
+
+import pytest
+
+from product_refinement.ai.service import (
+    AIService,
+    _CACHE_FILE_SUFFIX,
+    _JSON_ARRAY_RE,
+    _is_transient_error,
+)
+
+
+QUESTIONS_REPLY = (
+    'Here are my questions:\n```json\n'
+    '[{"section": "Users", "question": "Who is the primary user?"},\n'
+    ' {"section": "Scope", "question": "What is out of scope?"}]\n```'
+)
+
+
+class APIStatusError(Exception):
+    """Mimics the provider SDKs' base class for HTTP status errors."""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class AuthenticationError(APIStatusError):
+    pass
+
+
+class RateLimitError(APIStatusError):
+    pass
+
+
+class InternalServerError(APIStatusError):
+    pass
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+def test_authentication_error_is_not_retried():
+    assert not _is_transient_error(AuthenticationError("invalid api key", status_code=401))
+
+
+def test_bad_request_status_error_is_not_retried():
+    assert not _is_transient_error(APIStatusError("malformed request", status_code=400))
+
+
+def test_rate_limit_and_server_errors_are_retried():
+    assert _is_transient_error(RateLimitError("slow down", status_code=429))
+    assert _is_transient_error(InternalServerError("oops", status_code=503))
+
+
+def test_connection_errors_are_retried():
+    assert _is_transient_error(APIConnectionError("reset"))
+    assert _is_transient_error(ConnectionError("reset"))
+    assert _is_transient_error(TimeoutError())
+
+
+def test_other_errors_are_not_retried():
+    assert not _is_transient_error(ValueError("bad value"))
+
+
+def test_cache_key_ignores_whitespace_only_differences(config, fake_model):
+    service = AIService(config)
+    assert (service.get_cache_key("finalize_spec", "# Spec\n\nSome  text ")
+            == service.get_cache_key("finalize_spec", "# Spec Some text"))
+
+
+def test_cache_key_keeps_whitespace_when_normalization_is_off(config, fake_model):
+    config.NORMALIZE_CACHE_KEYS = False
+    service = AIService(config)
+    assert (service.get_cache_key("finalize_spec", "# Spec\n\nSome  text ")
+            != service.get_cache_key("finalize_spec", "# Spec Some text"))
+
+
+def test_cache_key_depends_on_method_model_and_arguments(config, fake_model):
+    service = AIService(config)
+    key = service.get_cache_key("finalize_spec", "spec")
+    assert key != service.get_cache_key("suggest_project_name", "spec")
+    assert key != service.get_cache_key("finalize_spec", "other spec")
+    config.MODEL_NAME = "another-model"
+    assert key != service.get_cache_key("finalize_spec", "spec")
+
+
+def test_cache_key_accepts_unhashable_arguments(config, fake_model):
+    service = AIService(config)
+    key = service.get_cache_key("generate_initial_spec", "idea", {"product_spec": "text"})
+    assert key == service.get_cache_key("generate_initial_spec", "idea", {"product_spec": "text"})
+    assert key != service.get_cache_key("generate_initial_spec", "idea", {"product_spec": "other"})
+
+
+def test_cached_call_round_trips_through_disk(config, fake_model, cache_backend, drain_cache_writes):
+    fake_model.reply = lambda prompt: QUESTIONS_REPLY
+    service = AIService(config)
+    questions = service.get_follow_up_questions("spec", "")
+    assert service.get_follow_up_questions("spec", "") == questions
+    assert len(fake_model.prompts) == 1
+
+    # A new service starts with an empty memory tier, so this hit comes from disk
+    drain_cache_writes()
+    assert AIService(config).get_follow_up_questions("spec", "") == questions
+    assert len(fake_model.prompts) == 1
+
+
+def test_diskcache_stores_json_bytes(config, fake_model, drain_cache_writes, monkeypatch):
+    pytest.importorskip("diskcache")
+    from product_refinement.ai import service as service_module
+    monkeypatch.setattr(service_module, "DISKCACHE_AVAILABLE", True)
+    service = AIService(config)
+    service.save_to_cache("key", {"answer": [1, 2]})
+    drain_cache_writes()
+    assert isinstance(service._disk_cache.get("key"), bytes)
+    assert service._read_from_disk_cache("key", 60) == {"answer": [1, 2]}
+
+
+def test_expired_file_cache_entry_is_ignored(config, fake_model, drain_cache_writes, monkeypatch):
+    from product_refinement.ai import service as service_module
+    monkeypatch.setattr(service_module, "DISKCACHE_AVAILABLE", False)
+    service = AIService(config)
+    service.save_to_cache("key", "value")
+    drain_cache_writes()
+    cache_file = os.path.join(config.CACHE_DIR, "key" + _CACHE_FILE_SUFFIX)
+    an_hour_ago = time.time() - 3600
+    os.utime(cache_file, (an_hour_ago, an_hour_ago))
+    assert service._read_from_disk_cache("key", 60) is None
+    assert service._read_from_disk_cache("key", 7200) == "value"
+
+
+def test_memory_cache_evicts_least_recently_used(config, fake_model, monkeypatch):
+    from product_refinement.ai import service as service_module
+    monkeypatch.setattr(service_module, "DISKCACHE_AVAILABLE", False)
+    config.MEMORY_CACHE_SIZE = 2
+    service = AIService(config)
+    service._remember("a", 1)
+    service._remember("b", 2)
+    service.get_cached_response("a")
+    service._remember("c", 3)
+    assert list(service._mem_cache) == ["a", "c"]
+
+
+def test_cache_disabled_always_calls_the_model(config, fake_model):
+    config.CACHE_ENABLED = False
+    service = AIService(config)
+    service.finalize_spec("spec")
+    service.finalize_spec("spec")
+    assert len(fake_model.prompts) == 2
+
+
+def test_prefetched_call_is_reused(config, fake_model):
+    release = threading.Event()
+
+    def reply(prompt):
+        release.wait(5)
+        return "# Final spec"
+
+    fake_model.reply = reply
+    service = AIService(config)
+    service.prefetch(service.finalize_spec, "spec")
+    assert len(service._speculative) == 1
+
+    release.set()
+    assert service.finalize_spec("spec") == "# Final spec"
+    assert service.finalize_spec("spec") == "# Final spec"
+    assert len(fake_model.prompts) == 1
+    assert not service._speculative
+
+
+def test_finished_prefetch_forgets_itself(config, fake_model):
+    service = AIService(config)
+    service.prefetch(service.finalize_spec, "spec")
+    deadline = time.monotonic() + 5
+    while service._speculative and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not service._speculative
+    assert service.get_cached_response(service.get_cache_key("finalize_spec", "spec")) is not None
+
+
+def test_prefetch_skips_cached_calls(config, fake_model):
+    service = AIService(config)
+    service.finalize_spec("spec")
+    service.prefetch(service.finalize_spec, "spec")
+    assert not service._speculative
+    assert len(fake_model.prompts) == 1
+
+
+def test_follow_up_questions_are_extracted_from_prose(config, fake_model):
+    fake_model.reply = lambda prompt: QUESTIONS_REPLY
+    questions = AIService(config).get_follow_up_questions("spec", "")
+    assert [q["section"] for q in questions] == ["Users", "Scope"]
+
+
+def test_follow_up_questions_skip_invalid_entries(config, fake_model):
+    fake_model.reply = lambda prompt: '[{"section": "Users", "question": "Who?"}, {"question": "No section?"}, 3]'
+    questions = AIService(config).get_follow_up_questions("spec", "")
+    assert questions == [{"section": "Users", "question": "Who?"}]
+
+
+def test_follow_up_questions_fall_back_to_text(config, fake_model):
+    fake_model.reply = lambda prompt: 'Scope:\n"question": "What platforms must be supported first?",\nThanks'
+    questions = AIService(config).get_follow_up_questions("spec", "")
+    assert questions == [{"section": "Scope", "question": "What platforms must be supported first?"}]
+
+
+def test_parse_json_array_ignores_brackets_in_prose(config, fake_model):
+    service = AIService(config)
+    text = 'See [1] below:\n[{"section": "A", "question": "Why?"}]\nand [2].'
+    assert service._parse_json_array(text) == [{"section": "A", "question": "Why?"}]
+
+
+def test_json_array_regex_finds_array_in_prose():
+    text = 'Questions:\n```json\n[ {"section": "A", "question": "Why?"} ,\n {"section": "B", "question": "How?"} ]\n```'
+    match = _JSON_ARRAY_RE.search(text)
+    assert match is not None
+    assert match.group(0).startswith("[") and match.group(0).endswith("]")
+
+
+def test_json_array_regex_fails_fast_on_truncated_array():
+    # Whitespace-separated objects with no closing bracket used to backtrack exponentially
+    text = "[" + "".join('{"question": "Q%d?"}   ' % i for i in range(40))
+    started = time.monotonic()
+    assert _JSON_ARRAY_RE.search(text) is None
+    assert time.monotonic() - started < 1.0
+
+
+def test_extract_questions_from_text_returns_first_question(config, fake_model):
+    text = "Users:\n- Who will use the product day to day?\nScope:\n- Which features are out of scope?"
+    questions = AIService(config)._extract_questions_from_text(text)
+    assert questions == [{"section": "Users", "question": "- Who will use the product day to day?"}]
+
+
+def test_suggested_project_name_drops_the_label(config, fake_model):
+    fake_model.reply = lambda prompt: "**Project Name:** Widget Pro"
+    assert AIService(config).suggest_project_name("spec") == "Widget Pro"
+
+
+TASKS_REPLY = (
+    "1. Set up the service\nComplexity: Low\nDependencies: None\nDescription: Create it.\n\n"
+    "2. Add metrics\nComplexity: High\nDependencies: Set up the service, Logging\n\n"
+    "Technical Notes: Use the existing exporter."
+)
+
+
+def test_todo_list_has_tasks_for_every_section_in_order(config, fake_model):
+    fake_model.reply = lambda prompt: TASKS_REPLY
+    todo_list = AIService(config).generate_todo_list("spec")
+    sections = ["Architecture", "Core Features", "Infrastructure", "Testing", "Documentation", "Security", "Performance"]
+    assert [task["section"] for task in todo_list["tasks"]] == [section for section in sections for _ in range(2)]
+    assert len(fake_model.prompts) == 7
+    assert config.DOCUMENT_TYPE == "product_requirements"
+
+    second = todo_list["tasks"][1]
+    assert second["title"] == "Add metrics"
+    assert second["dependencies"] == ["Set up the service", "Logging"]
+    assert second["description"] == "No description provided."
+    assert second["technical_notes"] == "Use the existing exporter."
+
+
+def test_todo_list_skips_sections_that_fail(config, fake_model):
+    fake_model.reply = lambda prompt: "" if "'Security'" in prompt else TASKS_REPLY
+    todo_list = AIService(config).generate_todo_list("spec")
+    assert "Security" not in {task["section"] for task in todo_list["tasks"]}
+    assert len(todo_list["tasks"]) == 12
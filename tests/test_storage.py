@@ -0,0 +1,73 @@
+"""Tests for saving, listing and loading specifications."""
+import json
+import os
+
+from product_refinement.utils.storage import SpecificationManager
+
+
+def _rewrite(path, **changes):
+    """Rewrite a saved specification in place with some fields changed."""
+    with open(path) as f:
+        data = json.load(f)
+    data.update(changes)
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def test_save_and_load_round_trip(config):
+    manager = SpecificationManager(config)
+    path = manager.save_specification("Widget Pro", "# Spec", "product_requirements")
+    loaded = manager.load_specification(path)
+    assert loaded["specification"] == "# Spec"
+    assert loaded["product_name"] == "Widget Pro"
+    assert loaded["version"] == 1
+    assert [name for name in os.listdir(os.path.dirname(path)) if ".tmp." in name] == []
+
+
+def test_saves_add_versions_to_the_listing(config):
+    manager = SpecificationManager(config)
+    manager.save_specification("Widget Pro", "# One", "product_requirements")
+    manager.save_specification("Widget Pro", "# Two", "product_requirements")
+    manager.save_specification("Other", "# Idea", "idea")
+    listing = manager.list_specifications()
+    assert [spec["version"] for spec in listing["widget_pro"]["product_requirements"]] == [1, 2]
+    assert list(manager.list_specifications(doc_type="idea")) == ["other"]
+    assert "specification" not in listing["other"]["idea"][0]
+
+
+def test_listing_reflects_files_rewritten_in_place(config):
+    manager = SpecificationManager(config)
+    path = manager.save_specification("Widget Pro", "# Spec", "product_requirements")
+    assert manager.list_specifications()["widget_pro"]["product_requirements"][0]["product_name"] == "Widget Pro"
+
+    _rewrite(path, product_name="Widget Pro Max")
+    assert manager.list_specifications()["widget_pro"]["product_requirements"][0]["product_name"] == "Widget Pro Max"
+
+
+def test_modifying_a_listing_does_not_affect_the_next(config):
+    manager = SpecificationManager(config)
+    manager.save_specification("Widget Pro", "# Spec", "product_requirements")
+    entries = list(manager.iter_specifications())
+    entries[0]["version"] = 99
+    assert next(manager.iter_specifications())["version"] == 1
+
+
+def test_loaded_specification_reflects_rewrites(config):
+    manager = SpecificationManager(config)
+    path = manager.save_specification("Widget Pro", "# Spec", "product_requirements")
+    manager.load_specification(path)["specification"] = "changed in memory"
+    _rewrite(path, specification="# Rewritten")
+    assert manager.load_specification(path)["specification"] == "# Rewritten"
+
+
+def test_legacy_specifications_are_migrated(config):
+    os.makedirs(config.SPECS_DIR, exist_ok=True)
+    legacy_path = os.path.join(config.SPECS_DIR, "legacy_app_v1.json")
+    with open(legacy_path, "w") as f:
+        json.dump({"product_name": "Legacy App", "specification": "# Old", "version": 1, "timestamp": 1}, f)
+
+    manager = SpecificationManager(config)
+    migrated = os.path.join(config.SPECS_DIR, "legacy_app", "product_requirements", "legacy_app_v1.json")
+    loaded = manager.load_specification(migrated)
+    assert loaded["specification"] == "# Old"
+    assert loaded["doc_type"] == "product_requirements"